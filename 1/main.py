@@ -1,7 +1,11 @@
 import math
+import os
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.figure import Figure
+
+from om.export import FigureExporter
+from om.recorder import TraceRecorder
 
 
 def funw(x):
@@ -23,15 +27,34 @@ def fsecder(x, stats):
     return (2 * x) ** 2
 
 
-def bisection(l, r, deltax):
-    stats = {'steps': 0, 'call_count': 0, 'points': [], 'interval': []}
+def f_batch(x, stats, mask):
+    stats['call_count'][mask] += 1
+    return funw(x)
+
+
+def fder_batch(x, stats, mask):
+    stats['call_count'][mask] += 1
+    return ((2 * x) ** 3) / 3
+
+
+def fsecder_batch(x, stats, mask):
+    stats['call_count'][mask] += 1
+    return (2 * x) ** 2
+
+
+# trace is 'full', 'ring' (last trace_capacity iterations) or 'off'.
+# The recorded points and intervals end up in stats as NumPy arrays.
+def bisection(l, r, deltax, trace='full', trace_capacity=64):
+    stats = {'steps': 0, 'call_count': 0}
+    points = TraceRecorder(trace, capacity=trace_capacity)
+    interval = TraceRecorder(trace, capacity=trace_capacity)
 
     # Step 1
     xm = (l + r) / 2
     L = r - l
     fxm = f(xm, stats)
-    stats['points'].append(xm)  # Save a point
-    stats['interval'].append(L)  # Save interval
+    points.append(xm)  # Save a point
+    interval.append(L)  # Save interval
 
     while True:
         stats['steps'] += 1
@@ -56,23 +79,22 @@ def bisection(l, r, deltax):
             l = x1
             r = x2
 
-        stats['points'].append(xm)  # Save a point
-        stats['interval'].append(L)  # Save interval
+        points.append(xm)  # Save a point
+        interval.append(L)  # Save interval
 
         # Step 6
         L = r - l
         if L < deltax:
+            stats['points'] = points.view()
+            stats['interval'] = interval.view()
             return xm, stats, funw(xm)
 
 
-def golden_section(l, r, deltax):
-    stats = {
-        'steps': 0,
-        'call_count': 0,
-        "intervals": [],
-        'points': [],
-        'interval': []
-    }
+def golden_section(l, r, deltax, trace='full', trace_capacity=64):
+    stats = {'steps': 0, 'call_count': 0}
+    points = TraceRecorder(trace, capacity=trace_capacity)
+    intervals = TraceRecorder(trace, shape=(2,), capacity=trace_capacity)
+    interval = TraceRecorder(trace, capacity=trace_capacity)
 
     # Step 1
     t = (-1 + math.sqrt(5)) / 2
@@ -81,9 +103,9 @@ def golden_section(l, r, deltax):
     x2 = l + t * L
     fx1 = f(x1, stats)
     fx2 = f(x2, stats)
-    stats['points'].append((x1 + x2) / 2)  # Save a point
-    stats['intervals'].append((l, r))
-    stats['interval'].append(L)  # Save interval
+    points.append((x1 + x2) / 2)  # Save a point
+    intervals.append((l, r))
+    interval.append(L)  # Save interval
 
     while True:
         stats['steps'] += 1
@@ -106,17 +128,23 @@ def golden_section(l, r, deltax):
             x1 = r - t * L
             fx1 = f(x1, stats)
 
-        stats['points'].append((x1 + x2) / 2)  # Save a point
-        stats['intervals'].append((l, r))
-        stats['interval'].append(L)  # Save interval
+        points.append((x1 + x2) / 2)  # Save a point
+        intervals.append((l, r))
+        interval.append(L)  # Save interval
 
         # Step 4
         if L < deltax:
+            stats['points'] = points.view()
+            stats['intervals'] = intervals.view()
+            stats['interval'] = interval.view()
             return (x1 + x2) / 2, stats, funw((x1 + x2) / 2)
 
 
-def newtons(x0, deltax):
-    stats = {'steps': 0, 'call_count': 0, 'points': [x0], 'interval': []}
+def newtons(x0, deltax, trace='full', trace_capacity=64):
+    stats = {'steps': 0, 'call_count': 0}
+    points = TraceRecorder(trace, capacity=trace_capacity)
+    interval = TraceRecorder(trace, capacity=trace_capacity)
+    points.append(x0)
 
     xinext = x0  # Setting the initial guess for the minimum point.
     while True:
@@ -124,28 +152,135 @@ def newtons(x0, deltax):
         xi = xinext
         xinext = xi - (fder(xi, stats) / fsecder(xi, stats))  # Newton's method formula.
 
-        stats['points'].append(xinext)  # Save a point
-        stats['interval'].append(abs(xi - xinext))  # Save interval
+        points.append(xinext)  # Save a point
+        interval.append(abs(xi - xinext))  # Save interval
 
         if abs(xi - xinext) < deltax:
+            stats['points'] = points.view()
+            stats['interval'] = interval.view()
             return xinext, stats, funw(xinext)
 
 
-def generate_graph(stats, filename: str) -> None:
+# Batched variants: every argument may be an array, each element is an
+# independent problem. Problems that already converged are masked out so their
+# steps and call counts match the scalar versions exactly. The working arrays
+# are updated in place, so scalar arguments become (and return) 1-element arrays.
+def bisection_batch(l, r, deltax):
+    l, r = np.broadcast_arrays(np.array(l, dtype=float, ndmin=1), np.array(r, dtype=float, ndmin=1))
+    l, r = l.copy(), r.copy()
+    active = np.ones(l.shape, dtype=bool)
+    stats = {'steps': np.zeros(l.shape, dtype=int), 'call_count': np.zeros(l.shape, dtype=int)}
+
+    # Step 1
+    xm = (l + r) / 2
+    L = r - l
+    fxm = f_batch(xm, stats, active)
+
+    while active.any():
+        stats['steps'][active] += 1
+        # Step 2
+        x1 = l + L / 4
+        fx1 = f_batch(x1, stats, active)
+        x2 = r - L / 4
+        fx2 = f_batch(x2, stats, active)
+
+        # Step 3
+        step3 = active & (fx1 < fxm)
+        r[step3] = xm[step3]
+        xm[step3] = x1[step3]
+        fxm[step3] = fx1[step3]
+        # Step 4
+        step4 = active & ~step3 & (fx2 < fxm)
+        l[step4] = xm[step4]
+        xm[step4] = x2[step4]
+        fxm[step4] = fx2[step4]
+        # Step 5
+        step5 = active & ~step3 & ~step4
+        l[step5] = x1[step5]
+        r[step5] = x2[step5]
+
+        # Step 6
+        L[active] = (r - l)[active]
+        active &= ~(L < deltax)
+
+    return xm, stats, funw(xm)
+
+
+def golden_section_batch(l, r, deltax):
+    l, r = np.broadcast_arrays(np.array(l, dtype=float, ndmin=1), np.array(r, dtype=float, ndmin=1))
+    l, r = l.copy(), r.copy()
+    active = np.ones(l.shape, dtype=bool)
+    stats = {'steps': np.zeros(l.shape, dtype=int), 'call_count': np.zeros(l.shape, dtype=int)}
+
+    # Step 1
+    t = (-1 + math.sqrt(5)) / 2
+    L = r - l
+    x1 = r - t * L
+    x2 = l + t * L
+    fx1 = f_batch(x1, stats, active)
+    fx2 = f_batch(x2, stats, active)
+
+    while active.any():
+        stats['steps'][active] += 1
+        step2 = active & (fx2 < fx1)
+        step3 = active & ~step2
+
+        # Step 2
+        l[step2] = x1[step2]
+        x1[step2] = x2[step2]
+        fx1[step2] = fx2[step2]
+        # Step 3
+        r[step3] = x2[step3]
+        x2[step3] = x1[step3]
+        fx2[step3] = fx1[step3]
+
+        L[active] = (r - l)[active]
+        x2[step2] = (l + t * L)[step2]
+        x1[step3] = (r - t * L)[step3]
+        # Each problem evaluates exactly one new point per step
+        fx2[step2] = f_batch(x2, stats, step2)[step2]
+        fx1[step3] = f_batch(x1, stats, step3)[step3]
+
+        # Step 4
+        active &= ~(L < deltax)
+
+    return (x1 + x2) / 2, stats, funw((x1 + x2) / 2)
+
+
+def newtons_batch(x0, deltax):
+    xinext = np.array(x0, dtype=float, ndmin=1)
+    active = np.ones(xinext.shape, dtype=bool)
+    stats = {'steps': np.zeros(xinext.shape, dtype=int), 'call_count': np.zeros(xinext.shape, dtype=int)}
+
+    while active.any():
+        stats['steps'][active] += 1
+        xi = xinext.copy()
+        step = np.divide(fder_batch(xi, stats, active),
+                         fsecder_batch(xi, stats, active),
+                         out=np.zeros_like(xi),
+                         where=active)
+        xinext = xi - step  # Newton's method formula.
+
+        active &= ~(np.abs(xi - xinext) < deltax)
+
+    return xinext, stats, funw(xinext)
+
+
+# Uses the object-oriented matplotlib API, so it can run in export workers
+def generate_graph(stats, filename: str, output_dir: str = '.') -> str:
     x = np.linspace(0, 10, 10000)
     y = funw(x)
-    points = np.array(stats['points'])
+    points = np.asarray(stats['points'])
 
     # Set color and size
     sizes = np.random.uniform(15, 80, len(points))
     colors = np.random.uniform(15, 80, len(points))
 
     # Find y from solutions
-    pointsy = []
-    for point in points:
-        pointsy.append(funw(point))
+    pointsy = funw(points)
 
-    fig, ax = plt.subplots()
+    fig = Figure()
+    ax = fig.subplots()
 
     ax.plot(x, y, 'r', zorder=1)
     ax.grid(alpha=.6, linestyle='--')
@@ -162,12 +297,13 @@ def generate_graph(stats, filename: str) -> None:
                            textcoords='offset points',
                            bbox=bbox_props)
 
-    plt.axhline(0, color='black', alpha=0.6)
-    plt.axvline(0, color='black', alpha=0.6)
-    plt.xlim((-0.5, 5.2))
-    plt.ylim((-1.5, 42))
-    plt.savefig(filename)
-    # plt.show()
+    ax.axhline(0, color='black', alpha=0.6)
+    ax.axvline(0, color='black', alpha=0.6)
+    ax.set_xlim((-0.5, 5.2))
+    ax.set_ylim((-1.5, 42))
+    path = os.path.join(output_dir, filename)
+    fig.savefig(path)
+    return path
 
 
 def print_results(algo_name: str, res):
@@ -212,9 +348,10 @@ def main():
     print_results("Golden-section search: ", golres)
     print_results("Newton's method:", newres)
 
-    generate_graph(bires[1], "bisection.png")
-    generate_graph(golres[1], "golden-section.png")
-    generate_graph(newres[1], "newtons.png")
+    with FigureExporter(".") as exporter:
+        exporter.submit(generate_graph, bires[1], "bisection.png")
+        exporter.submit(generate_graph, golres[1], "golden-section.png")
+        exporter.submit(generate_graph, newres[1], "newtons.png")
 
 
 if __name__ == "__main__":
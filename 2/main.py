@@ -2,11 +2,14 @@ import os
 
 import numpy as np
 
-import descent_methods as dm
-import nelder_mead as nm
+from om import descent as dm
+from om import nelder_mead as nm
+from om.export import FigureExporter
 import output as o
 
 
+# f only uses elementwise operations, so a (k x 2) batch is one call on its columns
+@nm.batched(lambda X: f(X.T))
 def f(x):
     return -0.125 * x[0] * x[1] * (1 - x[0] - x[1])
 
@@ -21,45 +24,49 @@ def main():
     a = 0
     b = 6
     starting_points = np.array([[0, 0], [1, 1], [a / 10, b / 10]])
-    o.better_3d_plot(f, starting_points, "starting_points.png")
-
-    print(f([0, 0]))
-    print(f([1, 1]))
-    print(f([0, 0.6]))
-
-    for starting_point in starting_points:
-        print("--------------------------------------------------------")
-        print(f"Starting point is [{starting_point[0]}, {starting_point[1]}]")
-
-        print("\nGradient descent:")
-        history, res, function_uses, stats_val = dm.gradient_descent(f, gradf, starting_point)
-        o.print_results(function_uses,
-                        history,
-                        res,
-                        len(history) - 1,
-                        stats_val=stats_val)
-        file = f"[{starting_point[0]}, {starting_point[1]}]"
-        o.better_3d_plot(f, history, f"gradient_descent_3d_{file}.png")
-        o.better_contour_plot(history, f"gradient_descent_contour_{file}.png")
-
-        print("\nSteepest descent:")
-        history, res, function_uses, stats_additional, stats_val = dm.steepest_descent(f, gradf, starting_point)
-        o.print_results(function_uses, history, res, len(history) - 1, stats_additional, stats_val)
-        o.better_3d_plot(f, history, f"steepest_descent_3d_{file}.png")
-        o.better_contour_plot(history, f"steepest_descent_contour_{file}.png")
-
-        print("\nNelder-Mead:")
-        res, history, function_uses = nm.nelder_mead(f, starting_point)
-        o.print_results_nelder(function_uses, history, res, len(history))
-        o.better_draw_triangles(
-            history + [res],
-            f"nelder_mead_better_triangles_{file}.png",
-            present=False)
-
-        print("--------------------------------------------------------")
-
-        input("Press Enter to continue...")
-        os.system('cls' if os.name == 'nt' else 'clear')
+
+    # Figures are rendered in the background while the solvers keep running
+    with FigureExporter("figures") as exporter:
+        exporter.submit(o.better_3d_plot, f, starting_points, "starting_points.png")
+
+        print(f([0, 0]))
+        print(f([1, 1]))
+        print(f([0, 0.6]))
+
+        for starting_point in starting_points:
+            print("--------------------------------------------------------")
+            print(f"Starting point is [{starting_point[0]}, {starting_point[1]}]")
+
+            print("\nGradient descent:")
+            history, res, function_uses, iterations = dm.gradient_descent(f, gradf, starting_point)
+            o.print_results(function_uses,
+                            history,
+                            res,
+                            iterations)
+            file = f"[{starting_point[0]}, {starting_point[1]}]"
+            exporter.submit(o.better_3d_plot, f, history, f"gradient_descent_3d_{file}.png")
+            exporter.submit(o.better_contour_plot, history, f"gradient_descent_contour_{file}.png")
+
+            print("\nSteepest descent:")
+            history, res, function_uses, stats_additional, iterations = dm.steepest_descent(f, gradf, starting_point)
+            o.print_results(function_uses, history, res, iterations, stats_additional)
+            exporter.submit(o.better_3d_plot, f, history, f"steepest_descent_3d_{file}.png")
+            exporter.submit(o.better_contour_plot, history, f"steepest_descent_contour_{file}.png")
+
+            print("\nNelder-Mead:")
+            cached_f = nm.CachedObjective(f)
+            res, history, function_uses = nm.nelder_mead(cached_f, starting_point, history=True, alpha=0.3)
+            print(f"Objective cache: {cached_f.hits} hits, {cached_f.misses} misses")
+            o.print_results_nelder(function_uses, history, res, len(history["coords"]))
+            final = np.array([point["coords"] for point in res])
+            exporter.submit(o.better_draw_triangles,
+                            np.concatenate([history["coords"], [final]]),
+                            f"nelder_mead_better_triangles_{file}.png")
+
+            print("--------------------------------------------------------")
+
+            input("Press Enter to continue...")
+            os.system('cls' if os.name == 'nt' else 'clear')
 
 
 if __name__ == "__main__":
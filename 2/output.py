@@ -1,8 +1,10 @@
 import os
 import pprint as pprint
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.figure import Figure
+
+from om.export import cached_render
 
 
 def gradf(x):
@@ -11,9 +13,78 @@ def gradf(x):
     return np.array([y1, y2])
 
 
-def better_3d_plot(f, points, filename, show=False):
+# Figures are built with the object-oriented API (no pyplot state), so the
+# functions below can run in parallel export workers, see export.py.
+# Evaluated surfaces and drawn figure backgrounds, keyed on the function,
+# the bounds and the grid resolution. Only the trajectory overlay is redrawn.
+# The caches belong to one process, so the plots using them are marked
+# cached_render to keep all their export jobs on one worker.
+_surfaces = {}
+_backgrounds = {}
+
+
+def contour_function(x):
+    return -0.125 * x[0] * x[1] * (1 - x[0] - x[1])
+
+
+def evaluate_surface(f, bounds=(0, 1), resolution=50):
+    key = (f, bounds, resolution)
+    if key not in _surfaces:
+        X1, X2 = np.meshgrid(np.linspace(*bounds, resolution),
+                             np.linspace(*bounds, resolution))
+        _surfaces[key] = X1, X2, f([X1, X2])
+    return _surfaces[key]
+
+
+def clear_plot_cache():
+    _backgrounds.clear()
+    _surfaces.clear()
+
+
+def _data_limits(ax):
+    if hasattr(ax, 'zz_dataLim'):  # 3D axes
+        return [ax.xy_dataLim, ax.zz_dataLim]
+    return [ax.dataLim]
+
+
+def _background(draw, f, bounds, resolution):
+    # Returns the cached figure for draw(), with its data limits reset to the
+    # background so a previous overlay does not widen the next one
+    key = (draw, f, bounds, resolution)
+    if key not in _backgrounds:
+        fig, ax = draw(*evaluate_surface(f, bounds, resolution))
+        _backgrounds[key] = fig, ax, [lim.frozen() for lim in _data_limits(ax)]
+
+    fig, ax, limits = _backgrounds[key]
+    for lim, saved in zip(_data_limits(ax), limits):
+        lim.set(saved)
+    ax.autoscale_view()
+    return fig, ax
+
+
+def _save(fig, filename, output_dir, show):
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, filename.replace(" ", ""))
+    fig.savefig(path)
+    if show:
+        # Only interactive use needs pyplot, it shows the saved image
+        import matplotlib.pyplot as plt
+        plt.imshow(plt.imread(path))
+        plt.axis('off')
+        plt.show()
+    return path
+
+
+def _save_overlay(fig, overlay, filename, output_dir, show):
+    path = _save(fig, filename, output_dir, show)
+    for artist in overlay:
+        artist.remove()
+    return path
+
+
+def _draw_3d_background(X1, X2, Z):
     # Create a 3D plot
-    fig = plt.figure(figsize=(4.5, 4.5))
+    fig = Figure(figsize=(4.5, 4.5))
     ax = fig.add_subplot(111, projection='3d', computed_zorder=False)
     # ax.view_init(elev=0, azim=180)
 
@@ -22,13 +93,24 @@ def better_3d_plot(f, points, filename, show=False):
     ax.zaxis.set_pane_color((1.0, 1.0, 1.0, 0.0))
 
     # Plot the function surface
-    X1, X2 = np.meshgrid(np.linspace(0, 1, 50), np.linspace(0, 1, 50))
-    Z = f([X1, X2])
     ax.plot_surface(X1, X2, Z, cmap='viridis', alpha=1, zorder=1)
 
+    # Set the axis labels and title
+    ax.set_xlabel('x1')
+    ax.set_ylabel('x2')
+    ax.set_zlabel('f(x1, x2)')
+    return fig, ax
+
+
+@cached_render
+def better_3d_plot(f, points, filename, show=False, bounds=(0, 1), resolution=50, output_dir='figures'):
+    fig, ax = _background(_draw_3d_background, f, bounds, resolution)
+    ax.set_prop_cycle(None)  # Same point colors as on a fresh figure
+    overlay = []
+
     # Plot the points as a scatter plot
     for point in points:
-        ax.scatter(point[0], point[1], f(point), 'bo-', s=30, zorder=2)
+        overlay.append(ax.scatter(point[0], point[1], f(point), 'bo-', s=30, zorder=2))
 
     # Add an annotation to the last point
     last_point = points[-1]
@@ -39,37 +121,27 @@ def better_3d_plot(f, points, filename, show=False):
     first_point_f = f(first_point)
     offset_x = 0.04
     offset_y = 0.04
-    ax.text(first_point[0] + offset_x,
-            first_point[1] + offset_y,
-            first_point_f,
-            "1",
-            color='black',
-            fontsize=8,
-            zorder=2)
+    overlay.append(ax.text(first_point[0] + offset_x,
+                           first_point[1] + offset_y,
+                           first_point_f,
+                           "1",
+                           color='black',
+                           fontsize=8,
+                           zorder=2))
 
     # Add a text label to the last point with an offset
     offset_x = -0.09
     offset_y = -0.09
-    ax.text(last_point[0] + offset_x,
-            last_point[1] + offset_y,
-            last_point_f,
-            str(len(points)),
-            color='black',
-            fontsize=8,
-            zorder=2)
-
-    # Set the axis labels and title
-    ax.set_xlabel('x1')
-    ax.set_ylabel('x2')
-    ax.set_zlabel('f(x1, x2)')
+    overlay.append(ax.text(last_point[0] + offset_x,
+                           last_point[1] + offset_y,
+                           last_point_f,
+                           str(len(points)),
+                           color='black',
+                           fontsize=8,
+                           zorder=2))
 
     # Show the plot
-    if not os.path.exists('figures'):
-        os.mkdir('figures')
-    plt.savefig("figures/" + filename.replace(" ", ""))
-    if show:
-        plt.show()
-    plt.close()
+    return _save_overlay(fig, overlay, filename, output_dir, show)
 
 
 def configurePlot(ax):
@@ -79,59 +151,45 @@ def configurePlot(ax):
     ax.xaxis.get_major_ticks()[0].label1.set_visible(False)
 
 
-def better_contour_plot(points, filename, show=False):
-    fig, ax = plt.subplots()
-
-    X, Y = np.meshgrid(np.arange(0, 1.1, 0.001), np.arange(0, 1.1, 0.001))
-    Z = -0.125 * X * Y * (1 - X - Y)
+def _draw_contour_background(X, Y, Z):
+    fig = Figure()
+    ax = fig.subplots()
 
     CS = ax.contour(X, Y, Z, 15, linewidths=0.3)
     ax.clabel(CS, inline=True, fontsize=9)
 
-    x_points = [{
-        'val': point[0],
-        'num': i + 1
-    } for i, point in enumerate(points)]
-    y_points = [{
-        'val': point[1],
-        'num': i + 1
-    } for i, point in enumerate(points)]
-
-    x_points_val = [x['val'] for x in x_points]
-    y_points_val = [y['val'] for y in y_points]
-    ax.plot(x_points_val, y_points_val, 'bo-')
-
     configurePlot(ax)
     ax.set_xlabel('x1')
     ax.set_ylabel('x2')
-    if not os.path.exists('figures'):
-        os.mkdir('figures')
-    plt.savefig("figures/" + filename.replace(" ", ""))
-    if show:
-        plt.show()
-    plt.close()
+    return fig, ax
 
 
-def better_draw_triangles(history, filename, present=False, show=False):
-    points = [[p[0]['coords'], p[1]['coords'], p[2]['coords'], p[0]['coords']]
-              for p in history]
+@cached_render
+def better_contour_plot(points, filename, show=False, f=contour_function, bounds=(0, 1.099), resolution=1100,
+                        output_dir='figures'):
+    fig, ax = _background(_draw_contour_background, f, bounds, resolution)
+
+    points = np.asarray(points)
+    overlay = ax.plot(points[:, 0], points[:, 1], 'bo-')
+
+    return _save_overlay(fig, overlay, filename, output_dir, show)
 
-    plt.figure('Nelder-Mead')
-    for point in points:
-        xs = [x[0] for x in point]
-        ys = [y[1] for y in point]
-        plt.plot(xs, ys, '-o')
+
+# history is an (iterations x (n + 1) x n) array of simplex coordinates
+def better_draw_triangles(history, filename, present=False, show=False, output_dir='figures'):
+    history = np.asarray(history)
+    closed = history[:, list(range(history.shape[1])) + [0]]  # Close each polygon
+
+    fig = Figure()
+    ax = fig.subplots()
+    for point in closed:
+        ax.plot(point[:, 0], point[:, 1], '-o')
 
         if present:
-            plt.savefig(filename.replace(" ", ""))
+            fig.savefig(filename.replace(" ", ""))
             input("Press Enter to continue...")
 
-    if not os.path.exists('figures'):
-        os.mkdir('figures')
-    plt.savefig("figures/" + filename.replace(" ", ""))
-    if show:
-        plt.show()
-    plt.close()
+    return _save(fig, filename, output_dir, show)
 
 
 def print_results(function_uses: int,
@@ -161,7 +219,7 @@ def print_results(function_uses: int,
 
 
 def print_results_nelder(function_uses: int,
-                         history: list,
+                         history: dict,
                          res,
                          iterations: int,
                          additional_task_stats: dict = {},
@@ -176,5 +234,6 @@ def print_results_nelder(function_uses: int,
     pprint.pprint(res)
 
     print("History:")
-    for point in history:
-        pprint.pprint(point)
+    for coords, values in zip(history["coords"], history["value"]):
+        pprint.pprint(coords)
+        pprint.pprint(values)
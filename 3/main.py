@@ -1,8 +1,8 @@
-from typing import Callable
-
 import numpy as np
 
-from nelder_mead import nelder_mead, find_best_points_index
+from om.constraints import ConstraintSet
+from om.nelder_mead import batched, nelder_mead, find_best_points_index
+from om.schedule import PenaltySchedule
 
 
 # Funkcija, kurią bandoma minimizuoti
@@ -26,51 +26,44 @@ def ineq_constraint3(x: list[float]) -> float:
     return -1 * x[2]
 
 
-# Baudos funkcija lygybėms ir nelygybėms
-def penalty(
-        x: list[float],
-        equality_constraints: list[Callable[[list[float]], float]],
-        inequality_constraints: list[Callable[[list[float]], float]],
-) -> float:
-    temp_sum = [0, 0]
-
-    for equality_constraint in equality_constraints:
-        temp_sum[0] += equality_constraint(x) ** 2
-
-    for inequality_constraint in inequality_constraints:
-        temp_sum[1] += max(0.0, inequality_constraint(x)) ** 2
-
-    return temp_sum[0] + temp_sum[1]
+# Baudos funkcija lygybėms ir nelygybėms, x gali būti taškas arba (k x n) taškų matrica
+def penalty(x, constraints: ConstraintSet):
+    return constraints.penalty(x)
 
 
 # Padidinta tikslinė funkcija su baudos sąlyga
-def b(
-        x: list[float],
-        r: float,
-        equality_constraints: list[Callable[[list[float]], float]],
-        inequality_constraint: list[Callable[[list[float]], float]],
-):
-    return f(x) + (1 / r) * penalty(x, equality_constraints, inequality_constraint)
+def b(x, r: float, constraints: ConstraintSet):
+    return f(np.asarray(x, dtype=float).T) + (1 / r) * penalty(x, constraints)
 
 
-# Optimizavimo funkcija naudojant Nelder-Mead algoritmą
-def optimize(
-        starting_point: list[float],
-        equality_constraints: list[Callable[[list[float]], float]],
-        inequality_constraints: list[Callable[[list[float]], float]],
-):
-    r = 4
+# Optimizavimo funkcija naudojant Nelder-Mead algoritmą. Su schedule
+# (PenaltySchedule) pradedama nuo schedule.r, vidinė tolerancija ir funkcijos
+# iškvietimų biudžetas priklauso nuo r, o ciklas baigiamas pagal schedule.done()
+def optimize(starting_point: list[float], constraints: ConstraintSet, schedule: PenaltySchedule = None):
+    r = 4 if schedule is None else schedule.r
     total_function_calls = 0
 
     current_point = starting_point
     print("---------------")
     for i in range(1, 100):
-        # Susapnuojama padidinta tikslinė funkcija optimizacijai
-        b_wrapped = lambda x: b(x, r, equality_constraints, inequality_constraints)
+        # Susapnuojama padidinta tikslinė funkcija optimizacijai, batch versija
+        # įvertina visą simpleksą vienu NumPy praėjimu
+        @batched(lambda X, r=r: b(X, r, constraints))
+        def b_wrapped(x, r=r):
+            return b(x, r, constraints)
+
+        tolerance, max_evaluations = 0.001, None
+        if schedule is not None:
+            tolerance, max_evaluations = schedule.tolerance(r), schedule.stage_budget()
 
         # Naudojamas Nelder-Mead algoritmas
-        simplex, _, function_calls = nelder_mead(b_wrapped, current_point)
+        simplex, _, function_calls = nelder_mead(
+            b_wrapped, current_point, tolerance, max_iterations=49, max_evaluations=max_evaluations
+        )
         new_point = simplex[find_best_points_index(simplex)]["coords"]
+        step = np.linalg.norm(new_point - current_point)
+        if schedule is not None:
+            schedule.record(r, tolerance, function_calls, step, constraints.violation(new_point))
         r = r / 2  # r dynaminis pritaikymas
         total_function_calls += function_calls
 
@@ -78,11 +71,84 @@ def optimize(
         f2 = 2 * new_point[0] * new_point[2]
         f3 = 2 * new_point[1] * new_point[2]
         print(
-            f"Iteracija {i}, dabartinis taškas: {new_point}, fig: ab = {f1}, ac = {f2}, bc = {f3}, baudos funkcijos reikšmė: {b_wrapped(new_point)}, r: {r}"
+            f"Iteracija {i}, dabartinis taškas: {new_point}, fig: ab = {f1}, ac = {f2}, bc = {f3}, baudos funkcijos reikšmė: {b(new_point, r, constraints)}, r: {r}"
+        )
+
+        # Patikrinama, ar pasiekta konvergencija
+        if schedule.done() if schedule is not None else step <= 0.001:
+            current_point = new_point
+            break
+        current_point = new_point
+
+    return current_point, f"fig: ab = {f1}, ac = {f2}, bc = {f3}", total_function_calls
+
+
+# Išplėstinė Lagranžo funkcija: lygybių daugikliai lam, nelygybių daugikliai mu.
+# Bauda (1 / r) * h^2 ta pati kaip b, todėl rho = 2 / r
+def augmented_lagrangian(x, r: float, constraints: ConstraintSet, lam, mu):
+    h, g = constraints.residuals(x)
+    shifted = np.maximum(0.0, mu + (2 / r) * g)
+    return (
+            f(np.asarray(x, dtype=float).T)
+            + h @ lam
+            + (1 / r) * (h ** 2).sum(axis=-1)
+            + (r / 4) * (shifted ** 2 - mu ** 2).sum(axis=-1)
+    )
+
+
+# Optimizavimas išplėstinės Lagranžo funkcijos (daugiklių) metodu. Daugikliai
+# atnaujinami po kiekvieno vidinio sprendimo, r mažinamas tik kai apribojimų
+# pažeidimas nesumažėja bent 4 kartus. Vidinis Nelder-Mead pradeda nuo
+# ankstesnio galutinio simplekso.
+def optimize_augmented(
+        starting_point: list[float], constraints: ConstraintSet, r=4, tolerance=0.001, min_size=0.01
+):
+    lam = np.zeros(len(constraints.equality))
+    mu = np.zeros(len(constraints.inequality))
+    total_function_calls = 0
+    violation = np.inf
+
+    current_point = np.array(starting_point, dtype=float)
+    simplex_coords = None
+    print("---------------")
+    for i in range(1, 100):
+        @batched(lambda X, r=r, lam=lam, mu=mu: augmented_lagrangian(X, r, constraints, lam, mu))
+        def l_wrapped(x, r=r, lam=lam, mu=mu):
+            return augmented_lagrangian(x, r, constraints, lam, mu)
+
+        simplex, _, function_calls = nelder_mead(
+            l_wrapped, current_point, tolerance, initial_simplex=simplex_coords, max_iterations=49
+        )
+        total_function_calls += function_calls
+        new_point = simplex[find_best_points_index(simplex)]["coords"]
+        # Kitas sprendimas pradedamas nuo šio simplekso, padidinto apie geriausią
+        # tašką iki min_size skersmens, kad subliūškęs simpleksas nesustotų vietoje.
+        # Į tašką sutraukto simplekso padidinti negalima, tada generuojamas naujas
+        simplex_coords = np.array([point["coords"] for point in simplex])
+        diameter = np.linalg.norm(simplex_coords - new_point, axis=1).max()
+        if diameter > 0:
+            simplex_coords = new_point + (simplex_coords - new_point) * max(1.0, min_size / diameter)
+        else:
+            simplex_coords = None
+
+        # Daugiklių atnaujinimas
+        h, g = constraints.residuals(new_point)
+        lam = lam + (2 / r) * h
+        mu = np.maximum(0.0, mu + (2 / r) * g)
+        new_violation = constraints.violation(new_point)
+        if new_violation > 0.25 * violation:
+            r = r / 2
+        violation = new_violation
+
+        f1 = 2 * new_point[0] * new_point[1]
+        f2 = 2 * new_point[0] * new_point[2]
+        f3 = 2 * new_point[1] * new_point[2]
+        print(
+            f"Iteracija {i}, dabartinis taškas: {new_point}, fig: ab = {f1}, ac = {f2}, bc = {f3}, pažeidimas: {violation}, daugikliai: {lam}, {mu}, r: {r}"
         )
 
         # Patikrinama, ar pasiekta konvergencija
-        if np.linalg.norm(new_point - current_point) <= 0.001:
+        if np.linalg.norm(new_point - current_point) <= tolerance and violation <= tolerance:
             current_point = new_point
             break
         current_point = new_point
@@ -92,34 +158,45 @@ def optimize(
 
 def main():
     points = [[0, 0, 0], [1, 1, 1], [3 / 10, 0 / 10, 6 / 10]]
-    eqc = [eq_constraint]
-    ineqc = [ineq_constraint1, ineq_constraint2, ineq_constraint3]
+    constraints = ConstraintSet(
+        [eq_constraint], [ineq_constraint1, ineq_constraint2, ineq_constraint3]
+    )
 
     for point in points:
         print("----------------------------------")
         print(f"Pradinis taškas: {point}")
-        print(f"Baudos funkcija pradiniame taške, kai r = 4: {b(point, 4, eqc, ineqc)}")
+        print(f"Baudos funkcija pradiniame taške, kai r = 4: {b(point, 4, constraints)}")
         print(f"Funkcijos reikšmė: {f(point)}")
 
+        # Apribojimų reikšmės paimamos iš ConstraintSet podėlio
+        equality, inequality = constraints.residuals(point)
         print("Lygybinių apribojimų reikšmės:")
-        print(f"{eq_constraint(point)}")
+        for value in equality:
+            print(f"{value}")
 
         print("Nelygybinių apribojimų reikšmės:")
-        print(f"{ineq_constraint1(point)}")
-        print(f"{ineq_constraint2(point)}")
-        print(f"{ineq_constraint3(point)}")
+        for value in inequality:
+            print(f"{value}")
 
         print("---------------")
         print("Kvadratinės baudos funkcijos reikšmė: ")
-        print(f"kai r = 0.002: {b(point, 0.002, eqc, ineqc)}")
-        print(f"kai r = 0.04: {b(point, 0.04, eqc, ineqc)}")
-        print(f"kai r = 0.2: {b(point, 0.2, eqc, ineqc)}")
-        print(f"kai r = 1: {b(point, 1, eqc, ineqc)}")
-        print(f"kai r = 5: {b(point, 5, eqc, ineqc)}")
-        print(f"kai r = 25: {b(point, 25, eqc, ineqc)}")
+        print(f"kai r = 0.002: {b(point, 0.002, constraints)}")
+        print(f"kai r = 0.04: {b(point, 0.04, constraints)}")
+        print(f"kai r = 0.2: {b(point, 0.2, constraints)}")
+        print(f"kai r = 1: {b(point, 1, constraints)}")
+        print(f"kai r = 5: {b(point, 5, constraints)}")
+        print(f"kai r = 25: {b(point, 25, constraints)}")
 
         print(
-            f"Minimumo taškas ir funkcijos iškvietimų skaičius: {optimize(point, eqc, ineqc)}"
+            f"Minimumo taškas ir funkcijos iškvietimų skaičius: {optimize(point, constraints)}"
+        )
+        schedule = PenaltySchedule()
+        print(
+            f"Su prisitaikančia tolerancija ir biudžetu: {optimize(point, constraints, schedule)}"
+        )
+        print(schedule.report())
+        print(
+            f"Išplėstinės Lagranžo funkcijos metodu: {optimize_augmented(point, constraints)}"
         )
 
 
@@ -0,0 +1,168 @@
+import argparse
+import csv
+import json
+import time
+import tracemalloc
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linprog as scipy_linprog
+
+from main import TableRow, optimize_linear_program
+from pricing import Dantzig
+from revised import solve_inequalities
+from two_phase import linprog
+
+
+def random_lp(m: int, n: int, density=1.0, seed=0):
+    """Random bounded and feasible min c x, A_ub x <= b_ub, x >= 0.
+
+    A_ub has nonnegative entries with at least one positive entry per column
+    and b_ub > 0, so the slack basis is feasible and every column is capped.
+    With density < 1 A_ub is a scipy.sparse CSR matrix.
+    """
+    rng = np.random.default_rng(seed)
+    if density < 1:
+        A = sparse.random(m, n, density=density, format="lil", random_state=rng)
+    else:
+        A = sparse.lil_matrix(rng.random((m, n)))
+    A[rng.integers(m, size=n), np.arange(n)] = rng.random(n) + 0.1
+    A = A.tocsr() if density < 1 else A.toarray()
+    b = rng.random(m) * n * density + 1
+    c = -rng.random(n)
+    return c, A, b
+
+
+def _dense(A):
+    return A.toarray() if sparse.issparse(A) else A
+
+
+def _tableau(c, A_ub, b_ub):
+    A = _dense(A_ub)
+    m, n = A.shape
+    slacks = np.eye(m)
+    table = [TableRow(list(c) + [0.0] * m, 0.0)]
+    table += [TableRow(list(A[i]) + list(slacks[i]), b_ub[i]) for i in range(m)]
+    pricing = Dantzig()
+    _, _, value = optimize_linear_program(table, n, pricing=pricing)
+    return value, pricing.iterations
+
+
+def _two_phase(c, A_ub, b_ub):
+    _, value, iterations = linprog(c, A_ub=A_ub, b_ub=b_ub)
+    return value, iterations
+
+
+def _revised(c, A_ub, b_ub):
+    _, _, value, iterations = solve_inequalities(c, A_ub, b_ub)
+    return value, iterations
+
+
+def _highs(method):
+    def solve(c, A_ub, b_ub):
+        result = scipy_linprog(c, A_ub=A_ub, b_ub=b_ub, method=method)
+        if result.status != 0:
+            raise ValueError(result.message)
+        return result.fun, result.nit
+    return solve
+
+
+# Every engine takes (c, A_ub, b_ub) and returns (objective value, iterations)
+ENGINES = {
+    "tableau": _tableau,
+    "two-phase": _two_phase,
+    "revised": _revised,
+    "highs": _highs("highs"),
+    "highs-ds": _highs("highs-ds"),
+    "highs-ipm": _highs("highs-ipm"),
+}
+
+
+def measure(engine, c, A_ub, b_ub, repeats=1, memory=True):
+    # Best wall time over the repeats, then one more run under tracemalloc.
+    # tracemalloc only sees Python allocations, not HiGHS' own C++ memory.
+    seconds = np.inf
+    for _ in range(repeats):
+        started = time.perf_counter()
+        value, iterations = engine(c, A_ub, b_ub)
+        seconds = min(seconds, time.perf_counter() - started)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        engine(c, A_ub, b_ub)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"seconds": seconds, "iterations": int(iterations), "peak_bytes": peak, "objective": float(value)}
+
+
+def run_benchmark(sizes=(50, 100, 200), densities=(1.0, 0.05), engines=None, seeds=(0,), repeats=1,
+                  memory=True, reference="highs", tolerance=1e-6):
+    """Solves random_lp(m, 2m, density, seed) with every engine.
+
+    Returns one record per (size, density, seed, engine) with the best wall
+    time, iterations, peak traced memory, objective and its relative error
+    against the `reference` engine. `agrees` is False when the error exceeds
+    `tolerance`; a failing engine gets its error message instead.
+    """
+    if engines is None:
+        engines = list(ENGINES)
+    records = []
+    for m in sizes:
+        for density in densities:
+            for seed in seeds:
+                c, A_ub, b_ub = random_lp(m, 2 * m, density, seed)
+                expected, _ = ENGINES[reference](c, A_ub, b_ub)
+                for name in engines:
+                    record = {"family": "dense" if density >= 1 else "sparse", "m": m, "n": 2 * m,
+                              "density": density, "seed": seed, "engine": name}
+                    try:
+                        record.update(measure(ENGINES[name], c, A_ub, b_ub, repeats, memory))
+                    except (ValueError, RuntimeError) as error:
+                        record.update(error=str(error), agrees=False)
+                        records.append(record)
+                        continue
+                    record["error"] = abs(record["objective"] - expected) / max(1.0, abs(expected))
+                    record["agrees"] = record["error"] <= tolerance
+                    records.append(record)
+    return records
+
+
+def write_report(records, filename: str) -> None:
+    # JSON for a .json filename, CSV otherwise
+    if filename.endswith(".json"):
+        with open(filename, "w") as file:
+            json.dump(records, file, indent=2)
+        return
+
+    fields = list(dict.fromkeys(key for record in records for key in record))
+    with open(filename, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Native simplex engines against scipy's HiGHS")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--densities", type=float, nargs="+", default=[1.0, 0.05])
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--output", default="benchmark.csv", help=".csv or .json report")
+    args = parser.parse_args()
+
+    records = run_benchmark(args.sizes, args.densities, args.engines, args.seeds, args.repeats,
+                            memory=not args.no_memory)
+    write_report(records, args.output)
+
+    for record in records:
+        status = "ok" if record["agrees"] else f"MISMATCH {record['error']}"
+        print(f"{record['family']:6} m={record['m']:<5} {record['engine']:10} "
+              f"{record.get('seconds', np.nan):9.4f}s {record.get('iterations', 0):6} it  {status}")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
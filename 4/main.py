@@ -1,6 +1,8 @@
 import numpy as np
 
-verbose = True
+from pricing import Dantzig
+from revised import find_basis
+from tableau import DenseTableau
 
 
 class TableRow:
@@ -12,118 +14,92 @@ class TableRow:
         return f"{self.cf}, {self.fval}"
 
 
-def pivoting(index: int, full_table: [TableRow], tolerance=1e-5) -> int:
-    min_ratio = float("inf")
-    pivot_row_index = -1
-
-    for i, row in enumerate(full_table[1:]):
-        if row.cf[index] > tolerance:
-            ratio = row.fval / row.cf[index]
-            # Bland's Rule: choose the smallest index if there's a tie To avoid cycling, Bland's Rule suggests always
-            # choosing the smallest index that satisfies the pivot selection criteria.
-            if ratio < min_ratio or (abs(ratio - min_ratio) < tolerance and i < pivot_row_index):
-                min_ratio = ratio
-                pivot_row_index = i
-
-    if pivot_row_index == -1:
-        # Handle the case where no valid pivot is found
-        return -1
-
-    return pivot_row_index + 1  # +1 to account for the objective function row
-
-
-def adjust_table(
-        full_table: [TableRow], pivot_row_index: int, pivot_col_index: int
-) -> None:
-    pivot = full_table[pivot_row_index].cf[pivot_col_index]
-
-    # Divide each element in the pivot row by the pivot.
-    # Pivot element should become 1.
-    pivot_row = full_table[pivot_row_index]
-    pivot_row.fval = pivot_row.fval / pivot
-    pivot_row.cf = [x / pivot for x in pivot_row.cf]
-
-    if verbose:
-        for row in full_table:
-            print(row)
-        print("---------")
-
-    for i in range(len(full_table)):
-        if i == pivot_row_index:
-            continue
-
-        same_col_as_pivot_el = full_table[i].cf[pivot_col_index]
-        new_pivot = full_table[pivot_row_index].cf[pivot_col_index]
-        ratio = same_col_as_pivot_el / new_pivot
-        if verbose:
-            print(f"Ratio: {ratio}")
-
-        full_table[i].cf = [
-            x - ratio * pivot_row_el
-            for x, pivot_row_el in zip(full_table[i].cf, pivot_row.cf)
-        ]
-
-        full_table[i].fval = full_table[i].fval - ratio * pivot_row.fval
-
-    if verbose:
-        for row in full_table:
-            print(row)
-
-
-def optimize_linear_program(full_table: [TableRow], var_count: int) -> None:
-    function_row = full_table[0]
-
-    while not all(num >= 0 for num in function_row.cf):
-        if verbose:
-            print("=====================================")
-            print("Current table:")
-            print_table(full_table)
-
-        pivot_col_index = np.argmin(function_row.cf)
-        if verbose:
-            print(
-                f"Smallest objective function coefficient (column index): {pivot_col_index}"
-            )
-
-        pivot_row_index = pivoting(pivot_col_index, full_table)
-        if verbose:
-            print(f"Smallest non-negative ratio index (row index): {pivot_row_index}")
-
-        pivot = full_table[pivot_row_index].cf[pivot_col_index]
-        if verbose:
-            print(f"Pivot: {pivot}")
-
-        adjust_table(full_table, pivot_row_index, pivot_col_index)
-
-        if verbose:
-            print("=====================================")
-            input("Waiting for input. Press any key...\n\n")
-
-    column_sums = [
-        sum(row.cf[i] for row in full_table) for i in range(len(full_table[0].cf))
-    ]
-    base_indexes = [index for index, value in enumerate(column_sums) if value == 1]
-
-    final_vars = [0] * var_count
-
-    for row in full_table[1:]:
-        for i in base_indexes:
-            if row.cf[i] == 1:
-                final_vars[i] = row.fval
-
-    if verbose:
+# Tracing: the solver takes an optional trace(event) callback that receives a
+# dict with a "kind" key for every step. Without one it prints nothing.
+# print_trace reproduces the interactive walkthrough, see also
+# tracing.EventLog for a structured log.
+#
+# pricing picks the entering column, see pricing.py (Dantzig's rule by default).
+# basis[i] is the basic column of constraint row i; without one the slack
+# (unit) columns of the table are used.
+def optimize_linear_program(full_table: [TableRow], var_count: int, pricing=None, trace=None, basis=None) -> None:
+    # The tableau is solved as a DenseTableau and copied back into full_table
+    tableau = DenseTableau.from_rows(full_table)
+    if pricing is None:
+        pricing = Dantzig()
+    pricing.start(tableau)
+    if basis is None:
+        basis = find_basis(tableau.table[1:])
+    basis = np.array(basis)
+
+    iteration = 0
+    while True:
+        pivot_col_index = pricing.select(tableau)
+        if pivot_col_index is None:
+            break
+
+        pivot_row_index = tableau.pivot_row(pivot_col_index)
+        if pivot_row_index == -1:
+            raise ValueError("Linear program is unbounded")
+        pivot = tableau.table[pivot_row_index, pivot_col_index]
+        if trace is not None:
+            trace({"kind": "pivot", "iteration": iteration, "pricing": pricing.name,
+                   "row": pivot_row_index, "column": pivot_col_index, "pivot": pivot,
+                   "tableau": tableau})
+
+        pricing.update(tableau, pivot_row_index, pivot_col_index)
+        tableau.pivot(pivot_row_index, pivot_col_index)
+        basis[pivot_row_index - 1] = pivot_col_index
+        iteration += 1
+
+        if trace is not None:
+            trace({"kind": "pivoted", "iteration": iteration, "tableau": tableau})
+
+    tableau.write_rows(full_table)
+
+    x = np.zeros(tableau.table.shape[1])
+    x[basis] = tableau.rhs[1:]
+    final_vars = x[:var_count].tolist()
+
+    result = final_vars, sorted(int(i) + 1 for i in basis), -tableau.rhs[0]
+    if trace is not None:
+        trace({"kind": "finished", "iterations": iteration, "result": result, "basis": basis,
+               "tableau": tableau})
+    return result
+
+
+def print_trace(event: dict) -> None:
+    # Trace hook that prints every step and waits for input after each pivot
+    if event["kind"] == "pivot":
+        tableau = event["tableau"]
+        print("=====================================")
+        print("Current table:")
+        print_table(tableau.to_rows(TableRow))
+        print(
+            f"Entering column chosen by {event['pricing']} pricing (column index): {event['column']}"
+        )
+        print(f"Smallest non-negative ratio index (row index): {event['row']}")
+        print(f"Pivot: {event['pivot']}")
+        # Multiple of the pivot row subtracted from every other row
+        for i, entry in enumerate(tableau.table[:, event["column"]]):
+            if i != event["row"]:
+                print(f"Ratio: {entry / event['pivot']}")
+    elif event["kind"] == "pivoted":
+        print_table(event["tableau"].to_rows(TableRow))
+        print("=====================================")
+        input("Waiting for input. Press any key...\n\n")
+    elif event["kind"] == "finished":
+        final_vars, base_indexes, optimum = event["result"]
         print("=====================================")
         print("Final Tableau:")
-        print_table(full_table)
+        print_table(event["tableau"].to_rows(TableRow))
 
-    print("=====================================")
-    print("Final Variables: ")
-    print(' | '.join(f"x{i + 1} = {val:8.4f}" for i, val in enumerate(final_vars[:var_count])))
-
-    print(f"\nBasis Indices: {', '.join(f'x{index + 1}' for index in base_indexes)}")
-    print(f"Optimum Value: {-function_row.fval:8.4f}")
+        print("=====================================")
+        print("Final Variables: ")
+        print(' | '.join(f"x{i + 1} = {val:8.4f}" for i, val in enumerate(final_vars)))
 
-    return final_vars, [x + 1 for x in base_indexes], -function_row.fval
+        print(f"\nBasis Indices: {', '.join(f'x{index}' for index in base_indexes)}")
+        print(f"Optimum Value: {optimum:8.4f}")
 
 
 def print_table(full_table):
@@ -152,7 +128,7 @@ def main() -> None:
     ]
     print("=====================================")
     print("Optimizing the generic task:")
-    print_results(optimize_linear_program(task, 7), 4)
+    print_results(optimize_linear_program(task, 7, trace=print_trace), 4)
 
     task_personal = [
         TableRow([2, -3, 0, -5, 0, 0, 0], 0),
@@ -163,7 +139,7 @@ def main() -> None:
 
     print("\n\n=====================================")
     print("Optimizing the personal task:")
-    print_results(optimize_linear_program(task_personal, 7), 4)
+    print_results(optimize_linear_program(task_personal, 7, trace=print_trace), 4)
 
 
 if __name__ == "__main__":
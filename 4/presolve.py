@@ -0,0 +1,219 @@
+import numpy as np
+
+
+class Presolve:
+    """Shrinks min c x, A_ub x <= b_ub, A_eq x = b_eq, lower <= x <= upper.
+
+    The reductions run until none applies: empty rows, singleton rows (an
+    equality fixes its variable, an inequality becomes a bound), fixed and
+    empty columns, duplicate rows, rows that are redundant or infeasible for
+    every x within the bounds, and implied free column singletons, which are
+    substituted out through their equality row. Removed rows and columns are
+    zeroed in the stored matrices so the row and column counts stay cheap.
+    reduced() returns the smaller problem and postsolve() maps its solution
+    back to the original variables. Raises ValueError like linprog when a
+    reduction proves the problem infeasible. A column in no row that could
+    improve the objective without limit only makes the problem unbounded if
+    the rest is feasible, so it is fixed at a finite value and listed in
+    `unbounded` for the caller to check once feasibility is known.
+    """
+
+    def __init__(self, c, A_ub, b_ub, A_eq, b_eq, lower, upper, tolerance=1e-9):
+        self.c = np.array(c, dtype=float)
+        self.A_ub, self.b_ub = np.array(A_ub, dtype=float), np.array(b_ub, dtype=float)
+        self.A_eq, self.b_eq = np.array(A_eq, dtype=float), np.array(b_eq, dtype=float)
+        self.lower, self.upper = np.array(lower, dtype=float), np.array(upper, dtype=float)
+        self.tolerance = tolerance
+
+        self.columns = np.ones(len(self.c), dtype=bool)
+        self.rows_ub = np.ones(len(self.b_ub), dtype=bool)
+        self.rows_eq = np.ones(len(self.b_eq), dtype=bool)
+        self.x = np.zeros(len(self.c))  # Values of the removed columns
+        self.constant = 0.0
+        self.substituted = []  # (column, equality row, right-hand side)
+        self.unbounded = []  # Empty columns with an unbounded improving direction
+
+        passes = (self._empty_rows, self._singleton_rows, self._fixed_columns, self._empty_columns,
+                  self._duplicate_rows, self._dominated_rows, self._singleton_columns)
+        while any([reduction() for reduction in passes]):
+            pass
+
+    @property
+    def removed_rows(self) -> int:
+        return int((~self.rows_ub).sum() + (~self.rows_eq).sum())
+
+    @property
+    def removed_columns(self) -> int:
+        return int((~self.columns).sum())
+
+    def reduced(self):
+        # (c, A_ub, b_ub, A_eq, b_eq, bounds) of the remaining problem; its
+        # objective differs from the original one by `constant`
+        cols = np.flatnonzero(self.columns)
+        return (self.c[cols],
+                self.A_ub[np.ix_(self.rows_ub, cols)], self.b_ub[self.rows_ub],
+                self.A_eq[np.ix_(self.rows_eq, cols)], self.b_eq[self.rows_eq],
+                list(zip(self.lower[cols], self.upper[cols])))
+
+    def postsolve(self, x_reduced) -> np.ndarray:
+        x = self.x.copy()
+        x[self.columns] = x_reduced
+        # Substitutions are undone last to first, so every other variable of
+        # their row already has its value
+        for j, row, b in reversed(self.substituted):
+            rest = row.copy()
+            rest[j] = 0
+            x[j] = (b - rest @ x) / row[j]
+        return x
+
+    def _fix(self, j: int, value: float) -> None:
+        if value < self.lower[j] - self._slack(value) or value > self.upper[j] + self._slack(value):
+            raise ValueError("Linear program is infeasible")
+        self.x[j] = value
+        self.constant += self.c[j] * value
+        self.b_ub -= self.A_ub[:, j] * value
+        self.b_eq -= self.A_eq[:, j] * value
+        self.A_ub[:, j] = 0
+        self.A_eq[:, j] = 0
+        self.columns[j] = False
+
+    def _drop_rows(self, ub, eq) -> bool:
+        ub, eq = np.asarray(ub, dtype=int), np.asarray(eq, dtype=int)
+        self.A_ub[ub] = 0
+        self.A_eq[eq] = 0
+        self.rows_ub[ub] = False
+        self.rows_eq[eq] = False
+        return len(ub) + len(eq) > 0
+
+    def _slack(self, b):
+        return self.tolerance * np.maximum(1, np.abs(b))
+
+    def _activity(self, A):
+        # Smallest and largest value of each row of A x within the bounds
+        with np.errstate(invalid="ignore"):
+            low = np.where(A > 0, A * self.lower, np.where(A < 0, A * self.upper, 0)).sum(axis=1)
+            high = np.where(A > 0, A * self.upper, np.where(A < 0, A * self.lower, 0)).sum(axis=1)
+        return low, high
+
+    def _empty_rows(self) -> bool:
+        empty_ub = np.flatnonzero(self.rows_ub & ~self.A_ub.any(axis=1))
+        empty_eq = np.flatnonzero(self.rows_eq & ~self.A_eq.any(axis=1))
+        if np.any(self.b_ub[empty_ub] < -self.tolerance) or np.any(np.abs(self.b_eq[empty_eq]) > self.tolerance):
+            raise ValueError("Linear program is infeasible")
+        return self._drop_rows(empty_ub, empty_eq)
+
+    def _singleton_rows(self) -> bool:
+        # Equalities a x_j = b fix x_j, inequalities a x_j <= b tighten a bound
+        singles_eq = np.flatnonzero(self.rows_eq & (np.count_nonzero(self.A_eq, axis=1) == 1))
+        for i in singles_eq:
+            j = np.flatnonzero(self.A_eq[i])
+            if len(j) == 1:  # An earlier fix may have emptied the row
+                self._fix(j[0], self.b_eq[i] / self.A_eq[i, j[0]])
+
+        singles_ub = np.flatnonzero(self.rows_ub & (np.count_nonzero(self.A_ub, axis=1) == 1))
+        for i in singles_ub:
+            j = np.flatnonzero(self.A_ub[i])[0]
+            bound = self.b_ub[i] / self.A_ub[i, j]
+            if self.A_ub[i, j] > 0:
+                self.upper[j] = min(self.upper[j], bound)
+            else:
+                self.lower[j] = max(self.lower[j], bound)
+            if self.lower[j] > self.upper[j] + self._slack(bound):
+                raise ValueError("Linear program is infeasible")
+
+        # Rows emptied by the fixes are checked by _empty_rows
+        self._drop_rows(np.intersect1d(singles_ub, np.flatnonzero(self.A_ub.any(axis=1))),
+                        np.intersect1d(singles_eq, np.flatnonzero(self.A_eq.any(axis=1))))
+        return len(singles_ub) + len(singles_eq) > 0
+
+    def _fixed_columns(self) -> bool:
+        fixed = np.flatnonzero(self.columns & np.isfinite(self.lower) &
+                               (self.upper - self.lower <= self._slack(self.lower)))
+        for j in fixed:
+            self._fix(j, self.lower[j])
+        return len(fixed) > 0
+
+    def _empty_columns(self) -> bool:
+        # A column in no row sits on whichever bound minimizes its cost. When
+        # that bound is infinite the column is recorded in `unbounded` and
+        # parked on a finite value so the other reductions can still run.
+        empty = np.flatnonzero(self.columns & ~self.A_ub.any(axis=0) & ~self.A_eq.any(axis=0))
+        for j in empty:
+            if self.c[j] > self.tolerance:
+                value = self.lower[j]
+            elif self.c[j] < -self.tolerance:
+                value = self.upper[j]
+            else:
+                value = np.nan  # Any value within the bounds
+            if np.isinf(value):
+                self.unbounded.append(j)
+            if not np.isfinite(value):
+                value = next((bound for bound in (self.lower[j], self.upper[j]) if np.isfinite(bound)), 0.0)
+            self._fix(j, value)
+        return len(empty) > 0
+
+    def _duplicate_rows(self) -> bool:
+        # Rows equal up to a positive factor (any factor for equalities)
+        removed_ub, removed_eq = [], []
+        for A, b, rows, removed, equality in ((self.A_ub, self.b_ub, self.rows_ub, removed_ub, False),
+                                              (self.A_eq, self.b_eq, self.rows_eq, removed_eq, True)):
+            active = np.flatnonzero(rows & A.any(axis=1))
+            if len(active) < 2:
+                continue
+            scale = np.abs(A[active]).max(axis=1)
+            if equality:
+                first = A[active, np.argmax(A[active] != 0, axis=1)]
+                scale *= np.sign(first)
+            normalized = A[active] / scale[:, None]
+            rhs = b[active] / scale
+            _, groups = np.unique(normalized.round(12), axis=0, return_inverse=True)
+            for group in np.unique(groups):
+                members = np.flatnonzero(groups.ravel() == group)
+                if len(members) < 2:
+                    continue
+                if equality:
+                    if np.ptp(rhs[members]) > self.tolerance * max(1, np.abs(rhs[members]).max()):
+                        raise ValueError("Linear program is infeasible")
+                    keep = members[0]
+                else:
+                    keep = members[rhs[members].argmin()]
+                removed.extend(active[members[members != keep]])
+        return self._drop_rows(removed_ub, removed_eq)
+
+    def _dominated_rows(self) -> bool:
+        low_ub, high_ub = self._activity(self.A_ub)
+        low_eq, high_eq = self._activity(self.A_eq)
+        if (np.any(self.rows_ub & (low_ub > self.b_ub + self._slack(self.b_ub))) or
+                np.any(self.rows_eq & (low_eq > self.b_eq + self._slack(self.b_eq))) or
+                np.any(self.rows_eq & (high_eq < self.b_eq - self._slack(self.b_eq)))):
+            raise ValueError("Linear program is infeasible")
+        return self._drop_rows(np.flatnonzero(self.rows_ub & (high_ub <= self.b_ub)), [])
+
+    def _singleton_columns(self) -> bool:
+        # A column that only appears in one equality row and whose bounds that
+        # row already implies is substituted out: x_j = (b - rest x) / a
+        candidates = np.flatnonzero(self.columns & ~self.A_ub.any(axis=0) &
+                                    (np.count_nonzero(self.A_eq, axis=0) == 1))
+        changed = False
+        for j in candidates:
+            i = np.flatnonzero(self.A_eq[:, j])
+            if len(i) != 1:
+                continue
+            i = i[0]
+            row, a, b = self.A_eq[i].copy(), self.A_eq[i, j], self.b_eq[i]
+            rest = row.copy()
+            rest[j] = 0
+            low, high = self._activity(rest[None, :])
+            implied = np.sort([(b - high[0]) / a, (b - low[0]) / a])
+            if implied[0] < self.lower[j] - self.tolerance or implied[1] > self.upper[j] + self.tolerance:
+                continue
+
+            self.substituted.append((j, row, b))
+            self.constant += self.c[j] * b / a
+            self.c -= self.c[j] * rest / a
+            self.c[j] = 0
+            self.A_eq[:, j] = 0
+            self.columns[j] = False
+            self._drop_rows([], [i])
+            changed = True
+        return changed
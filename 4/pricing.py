@@ -0,0 +1,140 @@
+import time
+
+import numpy as np
+
+
+class Dantzig:
+    """Enters the column with the most negative objective row coefficient.
+
+    Pricing rules are passed to optimize_linear_program. start() is called
+    once with the initial DenseTableau, select() returns the entering column
+    (None when the tableau is optimal) and update() is called before every
+    pivot so rules can maintain weights incrementally. `iterations` counts
+    the pivots of the last solve.
+    """
+
+    name = "dantzig"
+
+    def __init__(self, tolerance=1e-12):
+        self.tolerance = tolerance
+        self.iterations = 0
+
+    def start(self, tableau) -> None:
+        self.iterations = 0
+
+    def candidates(self, tableau, columns=slice(None)):
+        return np.flatnonzero(tableau.table[0, columns] < -self.tolerance)
+
+    def score(self, tableau, columns):
+        # Higher is better
+        return -tableau.table[0, columns]
+
+    def select(self, tableau):
+        columns = self.candidates(tableau)
+        if len(columns) == 0:
+            return None
+        return int(columns[self.score(tableau, columns).argmax()])
+
+    def update(self, tableau, row: int, col: int) -> None:
+        self.iterations += 1
+
+
+class SteepestEdge(Dantzig):
+    """Maximizes d_j^2 / gamma_j, gamma_j = 1 + ||column j||^2 (without row 0).
+
+    The weights are computed once and then updated exactly on every pivot.
+    """
+
+    name = "steepest-edge"
+
+    def start(self, tableau) -> None:
+        super().start(tableau)
+        self.weights = 1 + (tableau.table[1:] ** 2).sum(axis=0)
+
+    def score(self, tableau, columns):
+        return tableau.table[0, columns] ** 2 / self.weights[columns]
+
+    def update(self, tableau, row: int, col: int) -> None:
+        super().update(tableau, row, col)
+        body = tableau.table[1:]
+        theta = tableau.table[row] / tableau.table[row, col]
+        dots = body.T @ body[:, col]
+        self.weights += theta * (theta * self.weights[col] - 2 * dots)
+        np.maximum(self.weights, 1, out=self.weights)
+        self.weights[col] = 2  # The entering column becomes a unit column
+
+
+class Devex(Dantzig):
+    """Maximizes d_j^2 / w_j with approximate devex reference weights.
+
+    All weights start at 1 and are updated with the pivot row only, which is
+    much cheaper than exact steepest-edge weights.
+    """
+
+    name = "devex"
+
+    def start(self, tableau) -> None:
+        super().start(tableau)
+        self.weights = np.ones(tableau.table.shape[1])
+
+    def score(self, tableau, columns):
+        return tableau.table[0, columns] ** 2 / self.weights[columns]
+
+    def update(self, tableau, row: int, col: int) -> None:
+        super().update(tableau, row, col)
+        theta = tableau.table[row] / tableau.table[row, col]
+        np.maximum(self.weights, theta ** 2 * self.weights[col], out=self.weights)
+        self.weights[col] = 1
+
+
+class PartialPricing(Dantzig):
+    """Dantzig's rule over a window of `window` columns at a time.
+
+    The window moves on after every selection and only advances further when
+    it has no candidate, so most iterations look at a fraction of the row.
+    """
+
+    name = "partial"
+
+    def __init__(self, window=64, tolerance=1e-12):
+        super().__init__(tolerance)
+        self.window = window
+
+    def start(self, tableau) -> None:
+        super().start(tableau)
+        self.offset = 0
+
+    def select(self, tableau):
+        n = tableau.table.shape[1]
+        for _ in range(0, n, self.window):
+            columns = (self.offset + np.arange(min(self.window, n))) % n
+            self.offset = (self.offset + self.window) % n
+            found = columns[self.candidates(tableau, columns)]
+            if len(found) > 0:
+                return int(found[self.score(tableau, found).argmax()])
+        return None
+
+
+RULES = {rule.name: rule for rule in (Dantzig, SteepestEdge, Devex, PartialPricing)}
+
+
+def compare_pricing_rules(solve, make_table, rules=None):
+    """Solves fresh copies of one problem with each pricing rule.
+
+    solve(table, pricing=rule) runs the solver (e.g. a partial application of
+    optimize_linear_program), make_table() builds a new table. Returns
+    {rule name: {"iterations", "seconds", "optimum"}}.
+    """
+    if rules is None:
+        rules = [rule() for rule in RULES.values()]
+
+    report = {}
+    for rule in rules:
+        started = time.perf_counter()
+        result = solve(make_table(), pricing=rule)
+        report[rule.name] = {
+            "iterations": rule.iterations,
+            "seconds": time.perf_counter() - started,
+            "optimum": result[2],
+        }
+    return report
@@ -0,0 +1,269 @@
+import numpy as np
+from scipy import sparse
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu
+
+
+class BasisFactorization:
+    """LU factorization of the basis matrix with product-form (eta) updates.
+
+    Dense bases use LAPACK LU, scipy.sparse bases use SuperLU. Each basis
+    change appends one sparse eta vector instead of refactorizing. After
+    `refactor_every` updates the caller refactorizes from scratch, which keeps
+    the eta file short and resets accumulated rounding error.
+    """
+
+    def __init__(self, B, refactor_every=50):
+        self.refactor_every = refactor_every
+        self.refactor(B)
+
+    def refactor(self, B) -> None:
+        if sparse.issparse(B):
+            self.lu = splu(sparse.csc_matrix(B))
+            self.solve = self.lu.solve
+        else:
+            self.lu = lu_factor(B)
+            self.solve = lambda v, trans='N': lu_solve(self.lu, v, trans={'N': 0, 'T': 1}[trans])
+        self.etas = []
+
+    def needs_refactor(self) -> bool:
+        return len(self.etas) >= self.refactor_every
+
+    def ftran(self, v) -> np.ndarray:
+        # Solves B x = v
+        x = self.solve(np.asarray(v, dtype=float))
+        for r, rows, values, pivot in self.etas:
+            xr = x[r] / pivot
+            x[rows] -= xr * values
+            x[r] = xr
+        return x
+
+    def btran(self, v) -> np.ndarray:
+        # Solves B^T y = v
+        y = np.array(v, dtype=float)
+        for r, rows, values, pivot in reversed(self.etas):
+            y[r] = (y[r] - values @ y[rows] + pivot * y[r]) / pivot
+        return self.solve(y, trans='T')
+
+    def update(self, r: int, d) -> None:
+        # Column r of the basis was replaced by a column a with B^-1 a = d
+        rows = np.flatnonzero(d)
+        self.etas.append((r, rows, d[rows], d[r]))
+
+
+class ConstraintMatrix:
+    """Constraint columns [A | I] where the identity (slack) block is implicit.
+
+    A may be a dense array or a scipy.sparse matrix, which is kept in CSC
+    form so column access and A^T y only touch the stored nonzeros.
+    """
+
+    def __init__(self, A, slack=False):
+        self.is_sparse = sparse.issparse(A)
+        self.A = sparse.csc_matrix(A, dtype=float) if self.is_sparse else np.asarray(A, dtype=float)
+        self.m, self.n = self.A.shape
+        self.slack = slack
+        self.shape = (self.m, self.n + self.m if slack else self.n)
+
+    def column(self, j: int) -> np.ndarray:
+        column = np.zeros(self.m)
+        if j >= self.n:
+            column[j - self.n] = 1
+        elif self.is_sparse:
+            start, end = self.A.indptr[j], self.A.indptr[j + 1]
+            column[self.A.indices[start:end]] = self.A.data[start:end]
+        else:
+            column[:] = self.A[:, j]
+        return column
+
+    def basis_matrix(self, basis):
+        structural = np.flatnonzero(basis < self.n)
+        slacks = np.flatnonzero(basis >= self.n)
+        if self.is_sparse:
+            block = self.A[:, basis[structural]].tocoo()
+            rows = np.concatenate([block.row, basis[slacks] - self.n])
+            cols = np.concatenate([structural[block.col], slacks])
+            values = np.concatenate([block.data, np.ones(len(slacks))])
+            return sparse.csc_matrix((values, (rows, cols)), shape=(self.m, self.m))
+
+        B = np.zeros((self.m, self.m))
+        B[:, structural] = self.A[:, basis[structural]]
+        B[basis[slacks] - self.n, slacks] = 1
+        return B
+
+    def price(self, y, columns) -> np.ndarray:
+        # a_j^T y for the given columns; slack columns just pick one entry of y
+        products = np.empty(len(columns))
+        structural = columns < self.n
+        products[structural] = (self.A.T @ y)[columns[structural]]
+        products[~structural] = y[columns[~structural] - self.n]
+        return products
+
+
+def find_basis(A, tolerance=1e-9) -> np.ndarray:
+    # For every row, a column that is the matching unit vector (a slack column)
+    column_sums = np.abs(A).sum(axis=0)
+    basis = []
+    for i in range(A.shape[0]):
+        unit = np.flatnonzero((np.abs(A[i] - 1) < tolerance) &
+                              (np.abs(column_sums - 1) < tolerance))
+        if len(unit) == 0:
+            raise ValueError(f"Row {i} has no slack column to start the basis from")
+        basis.append(unit[0])
+    return np.array(basis)
+
+
+def revised_simplex(c, A, b, basis, refactor_every=50, tolerance=1e-9, max_iterations=None, factor=None):
+    """Minimizes c x subject to A x = b, x >= 0, from a primal feasible basis.
+
+    A is a dense array, a scipy.sparse matrix or a ConstraintMatrix. Only the
+    basis is factorized; every iteration prices the nonbasic columns against
+    y = B^-T c_B and solves one system for the entering column. A
+    BasisFactorization of the starting basis can be passed in as `factor`;
+    it is updated in place, so a caller can keep it for the next solve.
+    Returns (x, basis, objective value, iterations).
+    """
+    if max_iterations is None:
+        max_iterations = np.inf
+    if not isinstance(A, ConstraintMatrix):
+        A = ConstraintMatrix(A)
+    c = np.asarray(c, dtype=float)
+    b = np.asarray(b, dtype=float)
+    basis = np.array(basis)
+    is_basic = np.zeros(A.shape[1], dtype=bool)
+    is_basic[basis] = True
+    if factor is None:
+        factor = BasisFactorization(A.basis_matrix(basis), refactor_every)
+    x_basis = factor.ftran(b)
+
+    iterations = 0
+    while True:
+        # Pricing: reduced costs of the nonbasic columns only
+        y = factor.btran(c[basis])
+        nonbasic = np.flatnonzero(~is_basic)
+        reduced = c[nonbasic] - A.price(y, nonbasic)
+        if len(reduced) == 0 or reduced.min() >= -tolerance:
+            break
+        if iterations >= max_iterations:
+            raise RuntimeError(f"No optimum found in {max_iterations} iterations")
+        entering = nonbasic[reduced.argmin()]
+
+        # Ratio test over the positive entries of the entering column,
+        # smallest index among ties
+        d = factor.ftran(A.column(entering))
+        eligible = np.flatnonzero(d > tolerance)
+        if len(eligible) == 0:
+            raise ValueError("Linear program is unbounded")
+        ratios = x_basis[eligible] / d[eligible]
+        leaving = int(eligible[np.flatnonzero(ratios - ratios.min() <= tolerance)[0]])
+
+        theta = x_basis[leaving] / d[leaving]
+        changed = np.flatnonzero(d)
+        x_basis[changed] -= theta * d[changed]
+        x_basis[leaving] = theta
+        is_basic[basis[leaving]] = False
+        is_basic[entering] = True
+        basis[leaving] = entering
+        iterations += 1
+
+        if factor.needs_refactor():
+            factor.refactor(A.basis_matrix(basis))
+            x_basis = factor.ftran(b)
+        else:
+            factor.update(leaving, d)
+
+    x = np.zeros(A.shape[1])
+    x[basis] = x_basis
+    return x, basis, c @ x, iterations
+
+
+def dual_simplex(c, A, b, basis, refactor_every=50, tolerance=1e-9, max_iterations=None, factor=None):
+    """Minimizes c x subject to A x = b, x >= 0, from a dual feasible basis.
+
+    The basis must have nonnegative reduced costs but may be primal
+    infeasible, e.g. an optimal basis after the right-hand side changed.
+    Each iteration removes the most negative basic variable and keeps the
+    reduced costs nonnegative. Arguments and result match revised_simplex.
+    """
+    if max_iterations is None:
+        max_iterations = np.inf
+    if not isinstance(A, ConstraintMatrix):
+        A = ConstraintMatrix(A)
+    c = np.asarray(c, dtype=float)
+    b = np.asarray(b, dtype=float)
+    basis = np.array(basis)
+    is_basic = np.zeros(A.shape[1], dtype=bool)
+    is_basic[basis] = True
+    if factor is None:
+        factor = BasisFactorization(A.basis_matrix(basis), refactor_every)
+    x_basis = factor.ftran(b)
+
+    iterations = 0
+    while True:
+        leaving = int(x_basis.argmin())
+        if x_basis[leaving] >= -tolerance:
+            break
+        if iterations >= max_iterations:
+            raise RuntimeError(f"No optimum found in {max_iterations} iterations")
+
+        # Row `leaving` of B^-1 A over the nonbasic columns, and their reduced costs
+        unit = np.zeros(A.m)
+        unit[leaving] = 1
+        nonbasic = np.flatnonzero(~is_basic)
+        pivot_row = A.price(factor.btran(unit), nonbasic)
+        reduced = c[nonbasic] - A.price(factor.btran(c[basis]), nonbasic)
+
+        # Dual ratio test, smallest index among ties
+        eligible = np.flatnonzero(pivot_row < -tolerance)
+        if len(eligible) == 0:
+            raise ValueError("Linear program is infeasible")
+        ratios = np.maximum(reduced[eligible], 0) / -pivot_row[eligible]
+        entering = nonbasic[eligible[np.flatnonzero(ratios - ratios.min() <= tolerance)[0]]]
+
+        d = factor.ftran(A.column(entering))
+        theta = x_basis[leaving] / d[leaving]
+        changed = np.flatnonzero(d)
+        x_basis[changed] -= theta * d[changed]
+        x_basis[leaving] = theta
+        is_basic[basis[leaving]] = False
+        is_basic[entering] = True
+        basis[leaving] = entering
+        iterations += 1
+
+        if factor.needs_refactor():
+            factor.refactor(A.basis_matrix(basis))
+            x_basis = factor.ftran(b)
+        else:
+            factor.update(leaving, d)
+
+    x = np.zeros(A.shape[1])
+    x[basis] = x_basis
+    return x, basis, c @ x, iterations
+
+
+def solve_inequalities(c, A_ub, b_ub, refactor_every=50, tolerance=1e-9):
+    """Minimizes c x subject to A_ub x <= b_ub, x >= 0, with b_ub >= 0.
+
+    A_ub may be dense or scipy.sparse (CSR/CSC). Slack columns are implicit,
+    the identity block is never built, and the slack basis is the start.
+    Returns (x, basis, objective value, iterations); x has no slack entries
+    and basis indexes [A_ub | I].
+    """
+    if np.min(b_ub) < 0:
+        raise ValueError("b_ub must be nonnegative for the slack basis to be feasible")
+    A = ConstraintMatrix(A_ub, slack=True)
+    c = np.concatenate([np.asarray(c, dtype=float), np.zeros(A.m)])
+    basis = np.arange(A.n, A.n + A.m)
+
+    x, basis, value, iterations = revised_simplex(c, A, b_ub, basis, refactor_every, tolerance)
+    return x[:A.n], basis, value, iterations
+
+
+def optimize_revised(full_table, var_count: int, refactor_every=50):
+    # Same input and result as optimize_linear_program, solved by revised simplex
+    c = np.array(full_table[0].cf, dtype=float)
+    A = np.array([row.cf for row in full_table[1:]], dtype=float)
+    b = np.array([row.fval for row in full_table[1:]], dtype=float)
+
+    x, basis, value, _ = revised_simplex(c, A, b, find_basis(A), refactor_every)
+    return x[:var_count].tolist(), sorted(int(i) + 1 for i in basis), float(value - full_table[0].fval)
@@ -1,5 +1,3 @@
-import warnings
-
 from scipy.optimize import linprog
 
 # Coefficients of the objective function
@@ -18,14 +16,13 @@ x2_bounds = (0, None)
 x3_bounds = (0, None)
 
 # Solve the problem
-warnings.filterwarnings("ignore", category=DeprecationWarning)
-# method simplex will be removed in 1.11
+# method simplex was removed in scipy 1.11, HiGHS picks its own algorithm
 res = linprog(
     c,
     A_ub=A,
     b_ub=b,
     bounds=[x0_bounds, x1_bounds, x2_bounds, x3_bounds],
-    method="simplex",
+    method="highs",
 )
 
 print("Optimal value:", res.fun)
@@ -40,7 +37,7 @@ res = linprog(
     A_ub=A,
     b_ub=b,
     bounds=[x0_bounds, x1_bounds, x2_bounds, x3_bounds],
-    method="simplex",
+    method="highs",
 )
 
 print("Optimal value:", res.fun)
@@ -55,7 +52,7 @@ print("x:", res.x)
 #     A_ub=A,
 #     b_ub=b,
 #     bounds=[x0_bounds, x1_bounds, x2_bounds, x3_bounds],
-#     method="simplex",
+#     method="highs",
 # )
 #
 # print("Optimal value:", res.fun)
@@ -0,0 +1,92 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from revised import BasisFactorization
+from warm_start import WarmStartSolver
+
+
+# scipy.optimize.linprog status codes
+OPTIMAL, ITERATION_LIMIT, INFEASIBLE, UNBOUNDED = 0, 1, 2, 3
+
+
+def _failure(error) -> int:
+    if isinstance(error, RuntimeError):
+        return ITERATION_LIMIT
+    return INFEASIBLE if "infeasible" in str(error) else UNBOUNDED
+
+
+def _solve_chunk(c, A_ub, rhs, refactor_every, tolerance):
+    # Solves consecutive RHS vectors, first trying every optimal basis found so
+    # far: a basis stays optimal for a new b whenever B^-1 b >= 0
+    solver = WarmStartSolver(c, A_ub, refactor_every, tolerance)
+    known = []  # (basis, factorization) of every distinct optimal basis
+    xs = np.zeros((len(rhs), solver.A.n))
+    values = np.zeros(len(rhs))
+    status = np.full(len(rhs), OPTIMAL)
+    bases = []
+
+    for i, b in enumerate(rhs):
+        for basis, factor in known:
+            x_basis = factor.ftran(b)
+            if x_basis.min() >= -tolerance:
+                x = np.zeros(solver.A.shape[1])
+                x[basis] = x_basis
+                break
+        else:
+            try:
+                x, basis, _, _ = solver.solve(b)
+            except (ValueError, RuntimeError) as error:
+                # The solver keeps its previous basis for the next row
+                xs[i], values[i], status[i] = np.nan, np.nan, _failure(error)
+                bases.append(None)
+                continue
+            x = np.concatenate([x, np.zeros(solver.A.m)])
+            factor = BasisFactorization(solver.A.basis_matrix(basis), refactor_every)
+            known.insert(0, (basis, factor))
+
+        xs[i] = x[:solver.A.n]
+        values[i] = solver.c @ x
+        bases.append(tuple(sorted(basis)))
+
+    return xs, values, status, bases
+
+
+def solve_rhs_sweep(c, A_ub, rhs, max_workers=None, chunksize=None, refactor_every=50, tolerance=1e-9):
+    """Solves min c x, A_ub x <= b, x >= 0 for every row b of a (k x m) matrix.
+
+    Consecutive right-hand sides are solved in chunks. Within a chunk the
+    optimal bases are kept with their factorizations and reused whenever they
+    stay feasible; otherwise the last basis is warm started, or the row is
+    cold started when that basis cannot be repaired. Chunks run on a process
+    pool; max_workers=1 runs all rows here as one chunk.
+    Returns (x, values, basis_ids, bases, status): a (k x n) array of optimal
+    points, the k optimal values, for each row the index of its basis in the
+    (distinct bases x m) array `bases` of sorted basis column indices, and a
+    scipy.optimize.linprog status code per row. Rows that are infeasible or
+    unbounded have NaN x and value and basis id -1.
+    """
+    rhs = np.atleast_2d(np.asarray(rhs, dtype=float))
+    if chunksize is None and max_workers == 1:
+        chunksize = max(1, len(rhs))
+    elif chunksize is None:
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, -(-len(rhs) // (4 * workers)))
+    chunks = [rhs[i:i + chunksize] for i in range(0, len(rhs), chunksize)]
+    arguments = [(c, A_ub, chunk, refactor_every, tolerance) for chunk in chunks]
+
+    if max_workers == 1 or len(chunks) == 1:
+        results = [_solve_chunk(*args) for args in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_solve_chunk, *zip(*arguments)))
+
+    x = np.concatenate([result[0] for result in results])
+    values = np.concatenate([result[1] for result in results])
+    status = np.concatenate([result[2] for result in results])
+    basis_tuples = [basis for result in results for basis in result[3]]
+    distinct = {basis: i for i, basis in enumerate(dict.fromkeys(b for b in basis_tuples if b is not None))}
+    basis_ids = np.array([distinct.get(basis, -1) for basis in basis_tuples])
+    bases = np.array(list(distinct), dtype=int).reshape(len(distinct), -1)
+    return x, values, basis_ids, bases, status
@@ -0,0 +1,55 @@
+import numpy as np
+from scipy.linalg.blas import dger
+
+
+class DenseTableau:
+    """Simplex tableau stored as an (m + 1) x n float array plus an RHS vector.
+
+    Row 0 is the objective function row, the same layout as a list of
+    TableRow objects. from_rows() and write_rows() convert between the two.
+    """
+
+    def __init__(self, table, rhs):
+        self.table = np.array(table, dtype=float, order="C")
+        self.rhs = np.array(rhs, dtype=float)
+
+    @classmethod
+    def from_rows(cls, rows):
+        return cls([row.cf for row in rows], [row.fval for row in rows])
+
+    def to_rows(self, row_class):
+        return [row_class(cf.tolist(), float(fval)) for cf, fval in zip(self.table, self.rhs)]
+
+    def write_rows(self, rows) -> None:
+        # Copies the tableau back into existing TableRow objects
+        for row, cf, fval in zip(rows, self.table, self.rhs):
+            row.cf = cf.tolist()
+            row.fval = float(fval)
+
+    def pivot_row(self, col: int, tolerance=1e-5) -> int:
+        # Minimum ratio test over the constraint rows, -1 if the column is unbounded
+        column = self.table[1:, col]
+        eligible = column > tolerance
+        if not eligible.any():
+            return -1
+
+        ratios = np.full(len(column), np.inf)
+        np.divide(self.rhs[1:], column, out=ratios, where=eligible)
+        # Bland's Rule: among ratios tied with the minimum, take the smallest index
+        ties = np.flatnonzero(ratios - ratios.min() < tolerance)
+        return int(ties[0]) + 1  # +1 to account for the objective function row
+
+    def pivot(self, row: int, col: int) -> None:
+        # Pivot row is scaled so the pivot becomes 1, then every other row is
+        # eliminated with a single in-place rank-1 update
+        pivot = self.table[row, col]
+        self.table[row] /= pivot
+        self.rhs[row] /= pivot
+
+        factors = self.table[:, col].copy()
+        factors[row] = 0
+        # A C-ordered table.T is Fortran-ordered, so BLAS updates it without a
+        # copy; the result is still assigned in case the table was replaced by
+        # one in another memory order
+        self.table = dger(-1.0, self.table[row].copy(), factors, a=self.table.T, overwrite_a=1).T
+        self.rhs -= factors * self.rhs[row]
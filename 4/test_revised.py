@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from scipy.optimize import linprog as scipy_linprog
+
+from benchmark import random_lp
+from revised import solve_inequalities
+from sweep import solve_rhs_sweep
+from warm_start import WarmStartSolver
+
+
+def highs(c, A_ub, b_ub):
+    result = scipy_linprog(c, A_ub=A_ub, b_ub=b_ub, method="highs")
+    assert result.status == 0
+    return result.fun
+
+
+# refactor_every=1 refactorizes on every pivot, 2 and 3 keep short eta files
+@pytest.mark.parametrize("refactor_every", [1, 2, 3, 50])
+@pytest.mark.parametrize("density", [1.0, 0.2])
+def test_revised_simplex_agrees_with_highs(refactor_every, density):
+    for seed in range(10):
+        c, A_ub, b_ub = random_lp(15, 30, density, seed)
+        x, _, value, _ = solve_inequalities(c, A_ub, b_ub, refactor_every=refactor_every)
+        assert value == pytest.approx(highs(c, A_ub, b_ub), rel=1e-7, abs=1e-9)
+        assert np.all(x >= -1e-9)
+        assert np.all(A_ub @ x <= b_ub + 1e-7)
+
+
+def test_revised_simplex_unbounded():
+    # Column 1 only appears with a negative entry, so it can grow without limit
+    with pytest.raises(ValueError, match="unbounded"):
+        solve_inequalities([-1, -1], [[1, -1], [1, 0]], [1, 2], refactor_every=1)
+
+
+@pytest.mark.parametrize("refactor_every", [2, 50])
+def test_warm_start_agrees_with_highs(refactor_every):
+    rng = np.random.default_rng(0)
+    c, A_ub, b_ub = random_lp(15, 30, seed=3)
+    solver = WarmStartSolver(c, A_ub, refactor_every=refactor_every)
+    methods = set()
+    for _ in range(20):
+        # New right-hand sides often make the kept basis primal infeasible,
+        # which the dual simplex repairs
+        b = b_ub * rng.uniform(0.2, 1.5, len(b_ub))
+        x, _, value, _ = solver.solve(b)
+        methods.add(solver.method)
+        assert value == pytest.approx(highs(c, A_ub, b), rel=1e-7, abs=1e-9)
+        assert np.all(A_ub @ x <= b + 1e-7)
+    assert methods == {"primal", "dual"}
+
+    # A new cost vector keeps the basis primal feasible
+    c = -rng.random(len(c))
+    _, _, value, _ = solver.solve(b, c)
+    assert solver.method == "primal"
+    assert value == pytest.approx(highs(c, A_ub, b), rel=1e-7, abs=1e-9)
+
+
+def test_warm_start_recovers_after_a_failed_solve():
+    c, A_ub, b_ub = random_lp(6, 10, seed=1)
+    solver = WarmStartSolver(c, A_ub)
+    solver.solve(b_ub)
+    with pytest.raises(ValueError, match="infeasible"):
+        solver.solve(-b_ub - 1)
+
+    # The kept basis is still optimal for this right-hand side
+    _, _, value, iterations = solver.solve(0.7 * b_ub)
+    assert (solver.method, iterations) == ("primal", 0)
+    assert value == pytest.approx(highs(c, A_ub, 0.7 * b_ub), rel=1e-7, abs=1e-9)
+
+
+def test_warm_start_cold_starts():
+    # Mixed signs make the slack basis neither primal nor dual feasible
+    rng = np.random.default_rng(2)
+    solved = 0
+    for _ in range(50):
+        c, A_ub, b_ub = rng.normal(size=6), rng.normal(size=(4, 6)), rng.normal(size=4)
+        expected = scipy_linprog(c, A_ub=A_ub, b_ub=b_ub, method="highs")
+        solver = WarmStartSolver(c, A_ub)
+        if expected.status != 0:
+            with pytest.raises(ValueError):
+                solver.solve(b_ub)
+            continue
+        _, _, value, _ = solver.solve(b_ub)
+        assert value == pytest.approx(expected.fun, rel=1e-7, abs=1e-9)
+        solved += 1
+    assert solved > 0
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sweep_reports_failed_rows(max_workers):
+    # The slack basis of the first row is neither primal nor dual feasible,
+    # and the third row is infeasible
+    c, A_ub = [-1, -2], [[-1, 0], [1, 1]]
+    rhs = [[-1, 3], [-0.5, 4], [-5, 3], [-1, 3]]
+    x, values, basis_ids, bases, status = solve_rhs_sweep(c, A_ub, rhs, max_workers=max_workers, chunksize=2)
+    assert values[[0, 1, 3]] == pytest.approx([highs(c, A_ub, b) for b in np.take(rhs, [0, 1, 3], axis=0)])
+    assert np.isnan(values[2]) and np.all(np.isnan(x[2]))
+    assert list(status) == [0, 0, 2, 0]
+    assert basis_ids[2] == -1 and np.all(basis_ids[[0, 1, 3]] >= 0)
+    assert len(bases) == basis_ids.max() + 1
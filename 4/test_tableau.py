@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from tableau import DenseTableau
+
+
+def eliminate(table, rhs, row, col):
+    # Textbook pivot on copies, for comparison
+    table, rhs = np.array(table, dtype=float), np.array(rhs, dtype=float)
+    rhs[row] /= table[row, col]
+    table[row] /= table[row, col]
+    for i in range(len(table)):
+        if i != row:
+            rhs[i] -= table[i, col] * rhs[row]
+            table[i] -= table[i, col] * table[row]
+    return table, rhs
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_pivot_in_any_memory_order(order):
+    rng = np.random.default_rng(0)
+    table, rhs = rng.random((4, 6)) + 0.5, rng.random(4)
+    tableau = DenseTableau(np.asarray(table, order=order), rhs)
+    tableau.pivot(2, 3)
+    expected_table, expected_rhs = eliminate(table, rhs, 2, 3)
+    np.testing.assert_allclose(tableau.table, expected_table)
+    np.testing.assert_allclose(tableau.rhs, expected_rhs)
+
+    # A table replaced after construction is pivoted correctly too
+    tableau.table = np.asfortranarray(tableau.table)
+    tableau.pivot(1, 0)
+    expected_table, expected_rhs = eliminate(expected_table, expected_rhs, 1, 0)
+    np.testing.assert_allclose(tableau.table, expected_table)
+    np.testing.assert_allclose(tableau.rhs, expected_rhs)
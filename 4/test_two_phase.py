@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from scipy.optimize import linprog as scipy_linprog
+
+from two_phase import linprog
+
+# scipy.optimize.linprog status codes
+OPTIMAL, INFEASIBLE, UNBOUNDED = 0, 2, 3
+
+
+def random_problem(rng):
+    # Small sparse integer LP with <= and = rows and mixed bounds, often
+    # infeasible or unbounded, in scipy.optimize.linprog's argument order
+    m_ub, m_eq, n = rng.integers(0, 4), rng.integers(0, 4), rng.integers(2, 8)
+
+    def entries(shape):
+        return rng.integers(-9, 10, shape) * (rng.random(shape) < 0.4)
+
+    choices = [(0, None), (None, 0), (None, None), (-2, 3), (1, 1)]
+    bounds = [choices[k] for k in rng.choice(len(choices), n, p=[0.5, 0.15, 0.15, 0.15, 0.05])]
+    A_ub, b_ub = (entries((m_ub, n)), rng.integers(-5, 10, m_ub)) if m_ub else (None, None)
+    A_eq, b_eq = (entries((m_eq, n)), rng.integers(-5, 10, m_eq)) if m_eq else (None, None)
+    return entries(n), A_ub, b_ub, A_eq, b_eq, bounds
+
+
+def status(problem, presolve):
+    try:
+        _, value, _ = linprog(*problem, presolve=presolve)
+    except ValueError as error:
+        return (INFEASIBLE if "infeasible" in str(error) else UNBOUNDED), None
+    return OPTIMAL, value
+
+
+@pytest.mark.parametrize("presolve", [False, True])
+def test_agrees_with_highs(presolve):
+    rng = np.random.default_rng(1)
+    for _ in range(1500):
+        problem = random_problem(rng)
+        expected = scipy_linprog(*problem, method="highs")
+        found, value = status(problem, presolve)
+        assert found == expected.status, problem
+        if found == OPTIMAL:
+            assert value == pytest.approx(expected.fun, rel=1e-6, abs=1e-6), problem
+
+
+@pytest.mark.parametrize("presolve", [False, True])
+def test_infeasible_rows_with_an_unbounded_empty_column(presolve):
+    # Column 0 is in no row and improves without limit, but the rows have no
+    # feasible point, so the problem is infeasible, not unbounded
+    A_eq = [[0, 0, 0, 9, -1, 0], [0, 0, -8, 7, 0, 4], [0, 3, 0, 4, 0, 0]]
+    bounds = [(0, None), (1, 1), (-2, 3), (None, 0), (0, None), (None, 0)]
+    problem = ([-4, 0, 0, 0, 0, 0], [[0, 7, 0, 9, 0, 9]], [-3], A_eq, [2, -4, -2], bounds)
+    assert status(problem, presolve)[0] == INFEASIBLE
+
+
+def test_unbounded_empty_column():
+    problem = ([1, -1], [[1, 0]], [4], None, None, [(0, None), (0, None)])
+    assert status(problem, presolve=True)[0] == UNBOUNDED
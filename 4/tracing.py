@@ -0,0 +1,43 @@
+import time
+
+import numpy as np
+
+
+class EventLog:
+    """Trace hook that records solver events instead of printing them.
+
+    Pass an instance as `trace` to optimize_linear_program or
+    two_phase.linprog. Every event is stored as a dict with a "time" entry
+    from time.perf_counter(). Tableaux are live references that the solver
+    keeps modifying, so they are dropped unless keep_tables=True, in which
+    case a copy is stored.
+    """
+
+    def __init__(self, keep_tables=False):
+        self.keep_tables = keep_tables
+        self.events = []
+
+    def __call__(self, event: dict) -> None:
+        event = dict(event, time=time.perf_counter())
+        if "tableau" in event:
+            if self.keep_tables:
+                tableau = event["tableau"]
+                event["tableau"] = np.column_stack([tableau.table, tableau.rhs])
+            else:
+                del event["tableau"]
+        self.events.append(event)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def of_kind(self, kind: str) -> list:
+        return [event for event in self.events if event["kind"] == kind]
+
+    def pivot_times(self) -> np.ndarray:
+        # Seconds from each "pivot" event to the matching "pivoted" event
+        started = [event["time"] for event in self.of_kind("pivot")]
+        finished = [event["time"] for event in self.of_kind("pivoted")]
+        return np.subtract(finished, started[:len(finished)])
+
+    def clear(self) -> None:
+        self.events = []
@@ -0,0 +1,202 @@
+import numpy as np
+from scipy import sparse
+
+from presolve import Presolve
+from pricing import Dantzig
+from tableau import DenseTableau
+
+
+def _bounds(bounds, n):
+    # (lower, upper) arrays from scipy style bounds, None meaning unbounded
+    if bounds is None:
+        bounds = (0, None)
+    if len(bounds) == 2 and not np.iterable(bounds[0]) and not np.iterable(bounds[1]):
+        bounds = [bounds] * n
+    if len(bounds) != n:
+        raise ValueError(f"Expected {n} bounds, got {len(bounds)}")
+    lower = np.array([-np.inf if lo is None else lo for lo, _ in bounds], dtype=float)
+    upper = np.array([np.inf if hi is None else hi for _, hi in bounds], dtype=float)
+    if np.any(lower > upper):
+        raise ValueError("Linear program is infeasible: a lower bound exceeds its upper bound")
+    return lower, upper
+
+
+def _constraints(A, b, n):
+    if A is None:
+        return np.zeros((0, n)), np.zeros(0)
+    A = A.toarray() if sparse.issparse(A) else np.asarray(A, dtype=float)
+    return np.atleast_2d(A).astype(float), np.atleast_1d(np.asarray(b, dtype=float))
+
+
+def standard_form(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None):
+    """Rewrites min c x, A_ub x <= b_ub, A_eq x = b_eq, bounds as min c' y, A y = b, y >= 0.
+
+    Variables are shifted onto their lower bound, mirrored when only the
+    upper bound is finite and split into a positive and a negative part when
+    free. Finite upper bounds become extra <= rows, and every <= row gets a
+    slack column. Returns (c', A, b, slack, T, offset): slack[i] is the slack
+    column of row i (-1 for equality rows) and x = offset + T y[:T.shape[1]].
+    """
+    c = np.asarray(c, dtype=float)
+    n = len(c)
+    A_ub, b_ub = _constraints(A_ub, b_ub, n)
+    A_eq, b_eq = _constraints(A_eq, b_eq, n)
+    lower, upper = _bounds(bounds, n)
+
+    # x = offset + T y
+    shifted = np.isfinite(lower)
+    mirrored = ~shifted & np.isfinite(upper)
+    free = ~shifted & ~mirrored
+    offset = np.where(shifted, lower, np.where(mirrored, upper, 0.0))
+    sign = np.where(mirrored, -1.0, 1.0)
+    T = np.zeros((n, n + free.sum()))
+    T[np.arange(n), np.arange(n)] = sign
+    T[np.flatnonzero(free), n + np.arange(free.sum())] = -1
+
+    # Finite upper bounds of shifted variables: y_j <= upper_j - lower_j
+    capped = np.flatnonzero(shifted & np.isfinite(upper))
+    caps = np.zeros((len(capped), T.shape[1]))
+    caps[np.arange(len(capped)), capped] = 1
+
+    rows_ub = np.vstack([A_ub @ T, caps])
+    rhs_ub = np.concatenate([b_ub - A_ub @ offset, upper[capped] - lower[capped]])
+    m_ub, m_eq = len(rows_ub), len(A_eq)
+
+    A = np.zeros((m_ub + m_eq, T.shape[1] + m_ub))
+    A[:m_ub, :T.shape[1]] = rows_ub
+    A[m_ub:, :T.shape[1]] = A_eq @ T
+    A[np.arange(m_ub), T.shape[1] + np.arange(m_ub)] = 1
+    b = np.concatenate([rhs_ub, b_eq - A_eq @ offset])
+    slack = np.concatenate([T.shape[1] + np.arange(m_ub), np.full(m_eq, -1)])
+
+    cost = np.zeros(A.shape[1])
+    cost[:T.shape[1]] = T.T @ c
+    return cost, A, b, slack, T, offset
+
+
+def _iterate(tableau, basis, pricing, trace, phase):
+    # Pivots until the pricing rule finds no entering column, keeping basis[i]
+    # as the basic column of tableau row i + 1
+    pricing.start(tableau)
+    iterations = 0
+    while True:
+        col = pricing.select(tableau)
+        if col is None:
+            return iterations
+
+        row = tableau.pivot_row(col)
+        if row == -1:
+            raise ValueError("Linear program is unbounded")
+        if trace is not None:
+            trace({"kind": "pivot", "phase": phase, "iteration": iterations, "pricing": pricing.name,
+                   "row": row, "column": col, "pivot": tableau.table[row, col], "tableau": tableau})
+
+        pricing.update(tableau, row, col)
+        tableau.pivot(row, col)
+        basis[row - 1] = col
+        iterations += 1
+
+        if trace is not None:
+            trace({"kind": "pivoted", "phase": phase, "iteration": iterations, "tableau": tableau})
+
+
+def linprog(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, pricing=None, trace=None,
+            tolerance=1e-9, presolve=True):
+    """Minimizes c x subject to A_ub x <= b_ub, A_eq x = b_eq and bounds.
+
+    Arguments follow scipy.optimize.linprog; bounds default to x >= 0. The
+    problem is put in standard form (see standard_form) and solved with the
+    two-phase tableau simplex: Phase I starts from the slack columns plus
+    artificial columns for the rows without a usable slack and minimizes the
+    sum of the artificials, Phase II optimizes c from the basis it leaves.
+    With presolve=True the problem is first reduced by presolve.Presolve and
+    the solution is mapped back to the original variables; trace events then
+    describe the reduced problem.
+    Raises ValueError when the problem is infeasible or unbounded.
+    Returns (x, objective value, iterations of both phases).
+    """
+    if presolve:
+        n = len(c)
+        reduction = Presolve(c, *_constraints(A_ub, b_ub, n), *_constraints(A_eq, b_eq, n),
+                             *_bounds(bounds, n), tolerance)
+        x, _, iterations = linprog(*reduction.reduced(), pricing=pricing, trace=trace,
+                                   tolerance=tolerance, presolve=False)
+        # The reduced problem was solved, so it is feasible and any
+        # improving empty column makes the original one unbounded
+        if reduction.unbounded:
+            raise ValueError("Linear program is unbounded")
+        x = reduction.postsolve(x)
+        return x, float(np.asarray(c, dtype=float) @ x), iterations
+
+    cost, A, b, slack, T, offset = standard_form(c, A_ub, b_ub, A_eq, b_eq, bounds)
+    y, basis, iterations, tableau = solve_standard_form(cost, A, b, slack, pricing, trace, tolerance)
+    x = offset + T @ y[:T.shape[1]]
+    value = float(np.asarray(c, dtype=float) @ x)
+    if trace is not None:
+        result = x, sorted(int(i) + 1 for i in basis), value
+        trace({"kind": "finished", "iterations": iterations, "result": result, "tableau": tableau})
+    return x, value, iterations
+
+
+def solve_standard_form(cost, A, b, slack, pricing=None, trace=None, tolerance=1e-9):
+    """Minimizes cost y subject to A y = b, y >= 0 with the two-phase simplex.
+
+    The arguments are those returned by standard_form; slack[i] is a column
+    usable as the starting basic column of row i while b[i] >= 0, or -1.
+    Raises ValueError when the problem is infeasible or unbounded.
+    Returns (y, basis, iterations of both phases, final tableau), where
+    basis[i] is the basic column of row i; rows found redundant in Phase I
+    are dropped from it.
+    """
+    if pricing is None:
+        pricing = Dantzig()
+    A, b = np.array(A, dtype=float), np.array(b, dtype=float)
+    m, n = A.shape
+
+    # Rows with a negative right-hand side are negated, which also negates their slack
+    flip = b < 0
+    A[flip] *= -1
+    b[flip] *= -1
+    usable = (slack >= 0) & ~flip
+    needs = np.flatnonzero(~usable)
+
+    # Phase I tableau [A | artificials]; the objective row is the artificial
+    # cost row priced out against the starting basis
+    table = np.zeros((m + 1, n + len(needs)))
+    table[1:, :n] = A
+    table[1 + needs, n + np.arange(len(needs))] = 1
+    table[0, :n] = -A[needs].sum(axis=0)
+    rhs = np.concatenate([[-b[needs].sum()], b])
+    tableau = DenseTableau(table, rhs)
+    basis = np.where(usable, slack, 0)
+    basis[needs] = n + np.arange(len(needs))
+
+    iterations = 0
+    if len(needs) > 0:
+        iterations += _iterate(tableau, basis, pricing, trace, phase=1)
+        if -tableau.rhs[0] > tolerance * max(1.0, np.abs(b).sum()):
+            raise ValueError("Linear program is infeasible")
+
+        # Artificials still basic at zero level are pivoted out; rows with no
+        # other nonzero entry are linear combinations of the rest and dropped
+        redundant = []
+        for i in np.flatnonzero(basis >= n):
+            entries = np.flatnonzero(np.abs(tableau.table[i + 1, :n]) > tolerance)
+            if len(entries) == 0:
+                redundant.append(i)
+                continue
+            tableau.pivot(i + 1, entries[0])
+            basis[i] = entries[0]
+        keep = np.setdiff1d(np.arange(m + 1), np.array(redundant, dtype=int) + 1)
+        tableau = DenseTableau(tableau.table[keep, :n], tableau.rhs[keep])
+        basis = np.delete(basis, redundant)
+
+    # Phase II objective row priced out against the feasible basis
+    tableau.table[0] = cost - cost[basis] @ tableau.table[1:]
+    tableau.table[0, basis] = 0
+    tableau.rhs[0] = -cost[basis] @ tableau.rhs[1:]
+    iterations += _iterate(tableau, basis, pricing, trace, phase=2)
+
+    y = np.zeros(n)
+    y[basis] = tableau.rhs[1:]
+    return y, basis, iterations, tableau
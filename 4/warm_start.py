@@ -0,0 +1,71 @@
+import numpy as np
+
+from revised import BasisFactorization, ConstraintMatrix, dual_simplex, revised_simplex
+from two_phase import solve_standard_form, standard_form
+
+
+class WarmStartSolver:
+    """Re-solves min c x, A_ub x <= b_ub, x >= 0 for new b_ub or c vectors.
+
+    The final basis and its factorization are kept between solves. A new
+    right-hand side that leaves the basis primal feasible needs no pivots, one
+    that makes it infeasible is repaired with the dual simplex, and a new c is
+    handled by the primal simplex from the old basis. When the kept basis is
+    neither primal nor dual feasible the problem is cold started with the
+    two-phase simplex, whose optimal basis is kept. A failed solve raises
+    and leaves the previous basis in place. A_ub may be dense or
+    scipy.sparse; slack columns are implicit.
+    """
+
+    def __init__(self, c, A_ub, refactor_every=50, tolerance=1e-9):
+        self.A_ub = A_ub
+        self.A = ConstraintMatrix(A_ub, slack=True)
+        self.c = np.concatenate([np.asarray(c, dtype=float), np.zeros(self.A.m)])
+        self.refactor_every = refactor_every
+        self.tolerance = tolerance
+        self.basis = np.arange(self.A.n, self.A.n + self.A.m)  # Slack basis
+        self.factor = None
+        self.method = None  # "primal", "dual" or "two-phase", whichever the last solve used
+
+    def reduced_costs(self):
+        y = self.factor.btran(self.c[self.basis])
+        return self.c - self.A.price(y, np.arange(self.A.shape[1]))
+
+    def solve(self, b_ub, c=None):
+        """Returns (x, basis, objective value, iterations) like solve_inequalities."""
+        b_ub = np.asarray(b_ub, dtype=float)
+        if c is not None:
+            self.c[:self.A.n] = c
+        if self.factor is None:
+            self.factor = BasisFactorization(self.A.basis_matrix(self.basis), self.refactor_every)
+
+        try:
+            return self._solve(b_ub)
+        except (ValueError, RuntimeError):
+            # The solvers update the factorization in place on every pivot,
+            # so it is rebuilt for the basis that is kept
+            self.factor.refactor(self.A.basis_matrix(self.basis))
+            raise
+
+    def _solve(self, b_ub):
+        cold_iterations = 0
+        if self.factor.ftran(b_ub).min() >= -self.tolerance:
+            self.method = "primal"
+            solver = revised_simplex
+        elif self.reduced_costs().min() >= -self.tolerance:
+            self.method = "dual"
+            solver = dual_simplex
+        else:
+            # The two-phase simplex finds an optimal basis of [A_ub | I], from
+            # which the primal simplex below only recovers x
+            self.method = "two-phase"
+            solver = revised_simplex
+            cost, A, b, slack, _, _ = standard_form(self.c[:self.A.n], self.A_ub, b_ub)
+            _, basis, cold_iterations, _ = solve_standard_form(cost, A, b, slack, tolerance=self.tolerance)
+            self.factor.refactor(self.A.basis_matrix(basis))
+            self.basis = basis
+
+        x, basis, value, iterations = solver(self.c, self.A, b_ub, self.basis,
+                                             tolerance=self.tolerance, factor=self.factor)
+        self.basis = basis
+        return x[:self.A.n], self.basis.copy(), value, cold_iterations + iterations
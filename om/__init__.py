@@ -0,0 +1,42 @@
+"""Optimization methods: gradient descent, steepest descent, Nelder-Mead and
+penalty method helpers, with a common minimize(method=..., options=...) entry
+point.
+
+Submodules are imported on first use, so `import om` loads nothing but this
+file. matplotlib is only imported inside the om.export worker processes.
+"""
+import importlib
+
+SUBMODULES = ("constraints", "descent", "export", "multistart", "nelder_mead", "recorder", "result", "schedule",
+              "solvers")
+
+# Names available directly on the package and the submodule defining them
+_EXPORTS = {
+    "minimize": "solvers",
+    "METHODS": "solvers",
+    "OptimizeResult": "result",
+    "ConstraintSet": "constraints",
+    "PenaltySchedule": "schedule",
+    "TraceRecorder": "recorder",
+    "CachedObjective": "nelder_mead",
+    "batched": "nelder_mead",
+    "FigureExporter": "export",
+    "cached_render": "export",
+}
+
+__all__ = list(SUBMODULES) + list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
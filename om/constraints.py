@@ -0,0 +1,51 @@
+import numpy as np
+
+
+class ConstraintSet:
+    """Equality (h(x) = 0) and inequality (g(x) <= 0) constraints stacked together.
+
+    Constraints are callables that index their argument as x[0], x[1], ...
+    They are called on the transposed points, so one call per constraint
+    covers a whole (k x n) batch. The residuals of the last point or batch
+    are cached, so asking for the penalty, the violation and the residuals of
+    the same point evaluates the constraints once.
+    """
+
+    def __init__(self, equality=(), inequality=()):
+        self.equality = list(equality)
+        self.inequality = list(inequality)
+        self.evaluations = 0  # Points the constraints were evaluated at
+        self._key = None
+        self._residuals = None
+
+    def _stack(self, constraints, columns):
+        # (k x len(constraints)) array, constant constraints are broadcast
+        k = columns.shape[1]
+        if not constraints:
+            return np.zeros((k, 0))
+        return np.stack([np.broadcast_to(np.asarray(c(columns), dtype=float), (k,)) for c in constraints], axis=1)
+
+    def residuals(self, X):
+        """Returns (h, g) for one point (two vectors) or a (k x n) batch (two matrices)."""
+        X = np.asarray(X, dtype=float)
+        key = (X.shape, X.tobytes())
+        if key != self._key:
+            columns = np.atleast_2d(X).T
+            self.evaluations += columns.shape[1]
+            self._residuals = self._stack(self.equality, columns), self._stack(self.inequality, columns)
+            self._key = key
+
+        h, g = self._residuals
+        if X.ndim == 1:
+            return h[0], g[0]
+        return h, g
+
+    def penalty(self, X):
+        # Sum of squared equality residuals and squared inequality violations
+        h, g = self.residuals(X)
+        return (h ** 2).sum(axis=-1) + (np.maximum(0.0, g) ** 2).sum(axis=-1)
+
+    def violation(self, X):
+        # Largest constraint violation, 0 for a feasible point
+        h, g = self.residuals(X)
+        return np.maximum(np.abs(h).max(axis=-1, initial=0.0), g.max(axis=-1, initial=0.0))
@@ -2,10 +2,15 @@ import math
 
 import numpy as np
 
+from .recorder import TraceRecorder
 
-def gradient_descent(f, gradf, start, learning_rate=1, tolerance=0.001):
-    steps = [start]  # stat tracing
-    steps_val = [f(start)]
+
+# trace is 'full', 'ring' (last trace_capacity points) or 'off'; the returned
+# steps are a view of the recorded points, at most (iterations + 1) x n, and
+# iterations is counted whatever the trace mode keeps.
+def gradient_descent(f, gradf, start, learning_rate=1, tolerance=0.001, trace='full', trace_capacity=64):
+    steps = TraceRecorder(trace, shape=np.shape(start), capacity=trace_capacity)  # stat tracing
+    steps.append(start)
     function_uses = 0
     xi = start
 
@@ -15,12 +20,11 @@ def gradient_descent(f, gradf, start, learning_rate=1, tolerance=0.001):
 
         xi = xi - learning_rate * gradxi  # Find X_i+1 = X_i - gamma * gradf(X_i)
         steps.append(xi)  # stat tracing
-        steps_val.append(start)
 
         # ar sukonvergavo algoritmas
         if np.linalg.norm(learning_rate * gradxi) < tolerance:
             break
-    return steps, xi, function_uses, steps_val
+    return steps.view(), xi, function_uses, steps.count - 1
 
 
 def golden_section(xi, gradxi, func, l=0, r=5, deltax=0.001):
@@ -63,9 +67,9 @@ def golden_section(xi, gradxi, func, l=0, r=5, deltax=0.001):
             return (point1 + point2) / 2, stats
 
 
-def steepest_descent(f, gradf, start, tolerance=0.001):
-    steps = [start]  # stat tracing
-    steps_val = [f(start)]
+def steepest_descent(f, gradf, start, tolerance=0.001, trace='full', trace_capacity=64):
+    steps = TraceRecorder(trace, shape=np.shape(start), capacity=trace_capacity)  # stat tracing
+    steps.append(start)
     stats_additional = {"function_uses": 0, "iterations": 0, "count": 0}
     function_uses = 0
     xi = start
@@ -86,9 +90,8 @@ def steepest_descent(f, gradf, start, tolerance=0.001):
 
         xi = xi - learning_rate * gradxi  # Find X_i+1 = X_i - gamma * gradf(X_i)
         steps.append(xi)  # stat tracing
-        steps_val.append(start)
 
         # ar sukonvergavo algoritmas
         if np.linalg.norm(learning_rate * gradxi) < tolerance:
             break
-    return steps, xi, function_uses, stats_additional, steps_val
+    return steps.view(), xi, function_uses, stats_additional, steps.count - 1
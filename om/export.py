@@ -0,0 +1,84 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _use_agg():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def cached_render(render):
+    # Declares that render keeps module-level caches (evaluated surfaces, drawn
+    # backgrounds), so FigureExporter runs all of its jobs on the same worker
+    render.cached = True
+    return render
+
+
+class FigureExporter:
+    """Renders figure jobs on a process pool with the headless Agg backend.
+
+    A job is a module-level render function (e.g. output.better_3d_plot) and
+    its arguments; it is called with output_dir=self.output_dir and must
+    return the written path. submit() returns immediately, so solvers do not
+    wait on rendering. Use as a context manager or call close() to wait.
+
+    Every worker process has its own module-level caches, so jobs of a
+    cached_render function always go to the worker it was first given and
+    fill its caches once. Other jobs, and the first job of a cached_render
+    function, go to the worker with the fewest unfinished jobs, preferring
+    workers that no cached_render function owns.
+    """
+
+    def __init__(self, output_dir='figures', max_workers=None):
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        # One single-process executor per worker, so a job can be sent to a
+        # given process; idle executors never start theirs
+        self.workers = [ProcessPoolExecutor(max_workers=1, initializer=_use_agg)
+                        for _ in range(max_workers or os.cpu_count() or 1)]
+        self.routes = {}  # cached_render function -> worker index
+        self.jobs = []
+        self.assigned = []  # Worker index of every job
+
+    def _worker(self, render) -> int:
+        if render in self.routes:
+            return self.routes[render]
+        busy = [0] * len(self.workers)
+        for job, worker in zip(self.jobs, self.assigned):
+            busy[worker] += not job.done()
+        owned = set(self.routes.values())
+        worker = min(range(len(self.workers)), key=lambda i: (i in owned, busy[i]))
+        if getattr(render, "cached", False):
+            self.routes[render] = worker
+        return worker
+
+    def submit(self, render, *args, **kwargs):
+        worker = self._worker(render)
+        job = self.workers[worker].submit(render, *args, output_dir=self.output_dir, **kwargs)
+        self.jobs.append(job)
+        self.assigned.append(worker)
+        return job
+
+    def wait(self):
+        # Paths of every finished job; re-raises the first rendering error
+        paths = [job.result() for job in self.jobs]
+        self.jobs = []
+        self.assigned = []
+        return paths
+
+    def close(self):
+        try:
+            return self.wait()
+        finally:
+            for worker in self.workers:
+                worker.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            for worker in self.workers:
+                worker.shutdown(cancel_futures=True)
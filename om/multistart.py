@@ -0,0 +1,89 @@
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .solvers import minimize
+
+METHODS = ('gradient_descent', 'steepest_descent', 'nelder_mead')
+
+
+class ObjectiveHandle:
+    """Picklable reference to a module-level function.
+
+    Only the module and function names are sent to worker processes, the
+    function itself is imported again on first use there.
+    """
+
+    def __init__(self, module, name):
+        self.module = module
+        self.name = name
+        self._function = None
+
+    @classmethod
+    def of(cls, function):
+        if function is None or isinstance(function, cls):
+            return function
+        return cls(function.__module__, function.__qualname__)
+
+    def __call__(self, x):
+        if self._function is None:
+            self._function = getattr(importlib.import_module(self.module), self.name)
+        return self._function(x)
+
+    def __getstate__(self):
+        return {'module': self.module, 'name': self.name, '_function': None}
+
+
+def run_method(f, gradf, start, method):
+    # Returns (x, value, iterations, function_uses) for one start point and method
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {METHODS}")
+    options = {'alpha': 0.3} if method == 'nelder_mead' else None
+    result = minimize(f, start, method, jac=gradf, options=options)
+    return result.x, result.fun, result.nit, result.nfev
+
+
+def _run_task(task):
+    f, gradf, start_index, start, method = task
+    x, value, iterations, function_uses = run_method(f, gradf, start, method)
+    return start_index, method, x, value, iterations, function_uses
+
+
+def multistart(f, gradf, starting_points, methods=METHODS, max_workers=None, chunksize=1):
+    """Runs every method from every starting point on a process pool.
+
+    starting_points is an (M x n) array. f and gradf must be module-level
+    functions (or ObjectiveHandles); gradf may be None for Nelder-Mead only.
+    Returns a structured array with one row per start point and method; the
+    `best` field marks the lowest value found for each start point.
+    max_workers=1 runs everything in this process.
+    """
+    starting_points = np.atleast_2d(np.asarray(starting_points, dtype=float))
+    f, gradf = ObjectiveHandle.of(f), ObjectiveHandle.of(gradf)
+    tasks = [(f, gradf, i, start, method)
+             for i, start in enumerate(starting_points)
+             for method in methods]
+
+    if max_workers == 1:
+        results = list(map(_run_task, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_run_task, tasks, chunksize=chunksize))
+
+    n = starting_points.shape[1]
+    table = np.zeros(len(results), dtype=[('start', int),
+                                          ('method', 'U16'),
+                                          ('x', float, (n,)),
+                                          ('value', float),
+                                          ('iterations', int),
+                                          ('function_uses', int),
+                                          ('best', bool)])
+    for k, result in enumerate(results):
+        table[k] = result + (False,)
+
+    for i in range(len(starting_points)):
+        rows = np.flatnonzero(table['start'] == i)
+        table['best'][rows[table['value'][rows].argmin()]] = True
+
+    return table
@@ -0,0 +1,287 @@
+import itertools
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+from .recorder import TraceRecorder
+
+
+class CachedObjective:
+    """Memoizes an objective function in a bounded LRU cache.
+
+    Points are keyed on their exact float64 bytes, or on a copy rounded to
+    `decimals` places when it is given. `hits` and `misses` count cache use;
+    every miss is one real call of the wrapped function.
+    """
+
+    def __init__(self, f, maxsize=1024, decimals=None):
+        self.f = f
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, x):
+        x = np.asarray(x, dtype=float)
+        if self.decimals is not None:
+            x = np.round(x, self.decimals) + 0.0  # + 0.0 turns -0.0 into 0.0
+        return x.tobytes()
+
+    def __call__(self, x):
+        key = self.key(x)
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        self.misses += 1
+        value = self.f(x)
+        self.cache[key] = value
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+        return value
+
+    def many(self, X):
+        # Looks up every row of X and evaluates all misses in one batch
+        X = np.asarray(X, dtype=float)
+        keys = [self.key(x) for x in X]
+        values = np.empty(len(X))
+        missing = []
+        for i, key in enumerate(keys):
+            if key in self.cache:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                values[i] = self.cache[key]
+            else:
+                missing.append(i)
+
+        if missing:
+            self.misses += len(missing)
+            values[missing] = evaluate_many(self.f, X[missing])
+            for i in missing:
+                self.cache[keys[i]] = values[i]
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+        return values
+
+
+def batched(batch):
+    # Declares a batch version of an objective: batch takes a (k x n) array
+    # of points and returns k values
+    def decorate(f):
+        f.batch = batch
+        return f
+
+    return decorate
+
+
+def evaluate_many(f, X):
+    # One call for all rows when f is cached or declares a batch version
+    if isinstance(f, CachedObjective):
+        return f.many(X)
+    batch = getattr(f, "batch", None)
+    if batch is not None:
+        return np.asarray(batch(np.asarray(X, dtype=float)), dtype=float)
+    return np.array([f(x) for x in X])
+
+
+def simplex_coords(starting_point, alpha=0.5):
+    # Vertices of the simplex generate_simplex evaluates, see below
+    x0 = np.array(starting_point, dtype=float)
+    n = len(x0)
+    alpha = np.broadcast_to(np.asarray(alpha, dtype=float), (n,))
+
+    # Row 0 is the starting point, row i + 1 is shifted by `far` everywhere except i;
+    # column j is scaled by alpha[j]
+    near = (math.sqrt(n + 1) - 1) / (n * math.sqrt(2)) * alpha
+    far = (math.sqrt(n + 1) + n - 1) / (n * math.sqrt(2)) * alpha
+    coords = np.tile(x0, (n + 1, 1))
+    coords[1:] += far
+    coords[1:][np.diag_indices(n)] += near - far
+    return coords
+
+
+def generate_simplex(
+        f, starting_point, alpha=0.5
+):  # Alpha is basically the length of the side of the initial simplex, or one length per dimension
+    coords = simplex_coords(starting_point, alpha)
+    values = evaluate_many(f, coords)
+    return coords, values
+
+
+def to_points(coords, values):
+    # Adapter to the list of {"coords", "value"} dictionaries used by callers
+    return [
+        {"coords": x[0], "value": x[1]} for x in zip(np.array(coords), values)
+    ]
+
+
+def find_best_points_index(points):
+    return np.array([point["value"] for point in points]).argmin()
+
+
+def regularity(coords):
+    # |det E| / product of the edge lengths in E, the edges from vertex 0:
+    # 1 when they are orthogonal, near 0 when the simplex is flat
+    edges = coords[1:] - coords[0]
+    lengths = np.linalg.norm(edges, axis=1)
+    sign, log_volume = np.linalg.slogdet(edges)
+    if sign == 0 or np.any(lengths == 0):
+        return 0.0
+    return math.exp(log_volume - np.log(lengths).sum())
+
+
+def shrink(f, coords, values, gamma=0.5):
+    # In-place shrink towards row 0, which is the best vertex of a sorted simplex
+    coords[1:] = coords[0] + gamma * (coords[1:] - coords[0])
+    values[1:] = evaluate_many(f, coords[1:])
+
+
+# When the function's gradient is unavailable or expensive to compute.
+# The simplex is kept as an (n + 1) x n coordinate matrix plus a vector of
+# values, sorted once per iteration so the best vertex is row 0 and the worst
+# is row n. Returns (coords, values, history_coords, history_values,
+# function_calls); the two TraceRecorders count the iterations and with
+# history=True hold every iteration's simplex.
+# All evaluations go through a CachedObjective; pass one as f to read its hit
+# and miss counts. function_calls is the number of real evaluations.
+# With speculative=True the reflection, expansion and both contraction points
+# are evaluated in one call. Only one or two of them are used, so this trades
+# about twice the real evaluations for fewer calls of a batched objective.
+# alpha is the edge length of the simplex generated around starting_point, a
+# number or one length per dimension; initial_simplex, an (n + 1) x n array
+# such as the coordinates of a previous result, replaces it.
+# The search stops after max_iterations iterations (None for no limit), or
+# after the iteration in which function_calls reaches max_evaluations.
+# adaptive=True uses the dimension dependent coefficients of Gao and Han
+# (expansion 1 + 2/n, contraction 0.75 - 1/2n, shrink 1 - 1/n) instead of
+# 2, 0.5 and 0.5; for n <= 2 it is ignored and the classic coefficients are
+# used. With restart_volume set, a simplex whose regularity() drops below
+# restart_volume times that of the starting simplex is rebuilt around its
+# best vertex with the shape of the alpha simplex, scaled so its longest edge
+# from that vertex stays the same; restarts counts them.
+def simplex_search(f, starting_point, tolerance=0.001, history=False, cache_size=1024, speculative=False,
+                   initial_simplex=None, max_iterations=None, max_evaluations=None, alpha=0.5,
+                   adaptive=False, restart_volume=None):
+    if not isinstance(f, CachedObjective):
+        f = CachedObjective(f, cache_size)
+    misses_before = f.misses
+
+    # Generate Simplex Points
+    if initial_simplex is None:
+        coords, values = generate_simplex(f, starting_point, alpha)
+    else:
+        coords = np.array(initial_simplex, dtype=float)
+        values = evaluate_many(f, coords)
+
+    n = len(values) - 1  # Number of variables
+    restarts = 0
+    if restart_volume is not None:
+        start_regularity = regularity(coords)
+        # Longest edge from vertex 0 of the alpha simplex, whatever the start was
+        alpha_size = np.linalg.norm(simplex_coords(np.zeros(n), alpha)[1:], axis=1).max()
+
+    # Expansion, contraction and shrink coefficients (reflection is always 1)
+    if adaptive and n > 2:
+        chi, psi, sigma = 1 + 2 / n, 0.75 - 1 / (2 * n), 1 - 1 / n
+    else:
+        chi, psi, sigma = 2, 0.5, 0.5
+
+    # Stat tracing
+    mode = "full" if history else "off"
+    capacity = max_iterations or 64
+    history_coords = TraceRecorder(mode, shape=coords.shape, capacity=capacity)
+    history_values = TraceRecorder(mode, shape=values.shape, capacity=capacity)
+
+    iterations = itertools.count() if max_iterations is None else range(max_iterations)
+    for i in iterations:
+        # Select Worst Point
+        order = np.argsort(values, kind="stable")
+        coords, values = coords[order], values[order]
+        worst = coords[n]
+
+        # Find Centroid, its value is never needed
+        centroid = coords[:n].mean(axis=0)
+
+        # Candidate points: reflection, expansion, inside and outside contraction
+        direction = centroid - worst
+        xr = centroid + direction
+        xe = centroid + chi * direction
+        xic = centroid - psi * direction
+        xoc = centroid + psi * direction
+        if speculative:
+            f.many([xr, xe, xic, xoc])  # The calls below are cache hits
+
+        # Reflection
+        fxr = f(xr)
+
+        history_coords.append(coords)  # Stats
+        history_values.append(values)
+
+        # Try Expansion
+        if fxr <= values[0]:  # F(x_r) <= F(x^(0))
+            fxe = f(xe)
+
+            if fxe <= values[0]:  # F(x_e) <= F(x^(0))
+                coords[n], values[n] = xe, fxe
+            else:
+                coords[n], values[n] = xr, fxr
+        # Reflected is fine
+        elif fxr <= values[n - 1]:
+            coords[n], values[n] = xr, fxr
+        # Inside contraction
+        elif fxr >= values[n]:
+            fxic = f(xic)
+
+            if fxic <= values[n]:
+                coords[n], values[n] = xic, fxic
+            # Shrink
+            else:
+                shrink(f, coords, values, sigma)
+        # Outside contraction
+        else:
+            fxoc = f(xoc)
+
+            if fxoc <= values[n]:
+                coords[n], values[n] = xoc, fxoc
+            # Shrink
+            else:
+                shrink(f, coords, values, sigma)
+
+        if (
+                np.linalg.norm(coords[values.argmax()] - coords[values.argmin()])
+                <= tolerance
+        ):
+            break
+        if max_evaluations is not None and f.misses - misses_before >= max_evaluations:
+            break
+
+        # Restart on degeneracy, the best vertex value comes from the cache
+        if restart_volume is not None and regularity(coords) < restart_volume * start_regularity:
+            best = values.argmin()
+            size = np.linalg.norm(coords - coords[best], axis=1).max()
+            coords, values = generate_simplex(f, coords[best], np.asarray(alpha) * size / alpha_size)
+            restarts += 1
+
+    function_calls = f.misses - misses_before
+    return coords, values, history_coords, history_values, function_calls, restarts
+
+
+# simplex_search with the result converted back to a list of {"coords",
+# "value"} dictionaries. With history=True every iteration's simplex is
+# returned as {"coords", "value"} arrays of shape (iterations x (n + 1) x n)
+# and (iterations x (n + 1)), otherwise None.
+def nelder_mead(f, starting_point, tolerance=0.001, history=False, cache_size=1024, speculative=False,
+                initial_simplex=None, max_iterations=None, max_evaluations=None, alpha=0.5,
+                adaptive=False, restart_volume=None):
+    coords, values, history_coords, history_values, function_calls, _ = simplex_search(
+        f, starting_point, tolerance, history, cache_size, speculative,
+        initial_simplex, max_iterations, max_evaluations, alpha, adaptive, restart_volume
+    )
+
+    triangles = None
+    if history:
+        triangles = {"coords": history_coords.view(), "value": history_values.view()}
+    return to_points(coords, values), triangles, function_calls
@@ -0,0 +1,55 @@
+import numpy as np
+
+MODES = ('off', 'ring', 'full')
+
+
+class TraceRecorder:
+    """Stores one row per iteration in a preallocated NumPy buffer.
+
+    mode='off' only counts rows, mode='ring' keeps the last `capacity` rows
+    and mode='full' keeps every row, doubling the buffer when it fills up.
+    """
+
+    def __init__(self, mode='full', shape=(), capacity=64, dtype=np.float64):
+        if mode not in MODES:
+            raise ValueError(f"Unknown trace mode {mode!r}, expected one of {MODES}")
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+
+        self.mode = mode
+        self.shape = tuple(shape)
+        self.capacity = capacity
+        self.count = 0  # Rows recorded in total, including dropped ones
+
+        if mode == 'off':
+            rows = 0
+        elif mode == 'ring':
+            # Every row is written twice, so the last `capacity` rows are
+            # always one contiguous slice and view() never has to copy.
+            rows = 2 * capacity
+        else:
+            rows = capacity
+        self._data = np.empty((rows,) + self.shape, dtype=dtype)
+
+    def append(self, value) -> None:
+        if self.mode == 'ring':
+            i = self.count % self.capacity
+            self._data[i] = value
+            self._data[i + self.capacity] = value
+        elif self.mode == 'full':
+            if self.count == len(self._data):
+                grown = np.empty((2 * len(self._data),) + self.shape, dtype=self._data.dtype)
+                grown[:self.count] = self._data
+                self._data = grown
+            self._data[self.count] = value
+        self.count += 1
+
+    def view(self) -> np.ndarray:
+        """Recorded rows, oldest first, as a view into the buffer."""
+        if self.mode == 'ring' and self.count > self.capacity:
+            start = self.count % self.capacity
+            return self._data[start:start + self.capacity]
+        return self._data[:min(self.count, len(self._data))]
+
+    def __len__(self) -> int:
+        return len(self.view())
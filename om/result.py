@@ -0,0 +1,27 @@
+import numpy as np
+
+
+class OptimizeResult:
+    """Result of om.minimize, the same for every method.
+
+    x is the best point found and fun its value, nit the number of
+    iterations and nfev the number of objective evaluations (a gradient call
+    counts as two, as in om.descent). history holds the visited points, or
+    the simplices for Nelder-Mead, when the method recorded them. Method
+    specific values are kept in `info`.
+    """
+
+    def __init__(self, x, fun, nit, nfev, method, success=True, message="", history=None, **info):
+        self.x = np.asarray(x)
+        self.fun = fun
+        self.nit = nit
+        self.nfev = nfev
+        self.method = method
+        self.success = success
+        self.message = message
+        self.history = history
+        self.info = info
+
+    def __repr__(self) -> str:
+        return (f"OptimizeResult(method={self.method!r}, x={self.x}, fun={self.fun}, "
+                f"nit={self.nit}, nfev={self.nfev}, success={self.success})")
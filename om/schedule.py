@@ -0,0 +1,62 @@
+import numpy as np
+
+
+class PenaltySchedule:
+    """Inner tolerance and evaluation budget for every stage of a penalty loop.
+
+    The loop starts from the penalty parameter `r`. The inner tolerance
+    follows r: it is `start_tolerance` at the first r and shrinks in
+    proportion to r down to `final_tolerance`. Each stage may use at most
+    `stage_evaluations` function calls of the total `budget`. The loop is
+    done when the budget is spent, when a stage at the final tolerance moves
+    the point by no more than that tolerance, or when `patience` stages in a
+    row neither move the point by more than their tolerance nor halve the
+    constraint violation. `stages` records where the evaluations went and
+    `stop` why the loop ended.
+    """
+
+    def __init__(self, budget=1000, start_tolerance=0.05, final_tolerance=0.001, r=4,
+                 stage_evaluations=200, patience=2):
+        self.budget = budget
+        self.start_tolerance = start_tolerance
+        self.final_tolerance = final_tolerance
+        self.r = r
+        self.stage_evaluations = stage_evaluations
+        self.patience = patience
+        self.stages = []
+        self.stop = None
+
+    @property
+    def spent(self) -> int:
+        return sum(stage["evaluations"] for stage in self.stages)
+
+    def tolerance(self, r: float) -> float:
+        return float(np.clip(self.start_tolerance * r / self.r, self.final_tolerance, self.start_tolerance))
+
+    def stage_budget(self) -> int:
+        return max(0, min(self.stage_evaluations, self.budget - self.spent))
+
+    def record(self, r: float, tolerance: float, evaluations: int, step: float, violation: float) -> None:
+        self.stages.append({"r": r, "tolerance": tolerance, "budget": self.stage_budget(),
+                            "evaluations": evaluations, "step": step, "violation": violation})
+
+    def done(self) -> bool:
+        last = self.stages[-1]
+        if self.spent >= self.budget:
+            self.stop = "budget"
+        elif last["tolerance"] <= self.final_tolerance and last["step"] <= self.final_tolerance:
+            self.stop = "converged"
+        elif len(self.stages) > self.patience and all(
+                stage["step"] <= stage["tolerance"] and stage["violation"] > 0.5 * previous["violation"]
+                for previous, stage in zip(self.stages[-self.patience - 1:], self.stages[-self.patience:])
+        ):
+            self.stop = "stalled"
+        return self.stop is not None
+
+    def report(self) -> str:
+        lines = [f"{'stage':>5} {'r':>10} {'tolerance':>10} {'evaluations':>11} {'step':>10} {'violation':>10}"]
+        for i, stage in enumerate(self.stages, 1):
+            lines.append(f"{i:5} {stage['r']:10.4g} {stage['tolerance']:10.4g} {stage['evaluations']:11} "
+                         f"{stage['step']:10.4g} {stage['violation']:10.4g}")
+        lines.append(f"{self.spent} of {self.budget} evaluations, stopped: {self.stop}")
+        return "\n".join(lines)
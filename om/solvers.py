@@ -0,0 +1,52 @@
+from . import descent
+from . import nelder_mead as nm
+from .result import OptimizeResult
+
+METHODS = ("nelder_mead", "gradient_descent", "steepest_descent")
+
+
+def _nelder_mead(fun, x0, jac, options):
+    coords, values, history_coords, history_values, function_calls, restarts = nm.simplex_search(
+        fun, x0, **options
+    )
+    best = values.argmin()
+    history = None
+    if options.get("history"):
+        history = {"coords": history_coords.view(), "value": history_values.view()}
+    return OptimizeResult(coords[best], values[best], history_coords.count, function_calls, "nelder_mead",
+                          history=history, simplex=coords, restarts=restarts)
+
+
+def _gradient_descent(fun, x0, jac, options):
+    history, x, function_uses, iterations = descent.gradient_descent(fun, jac, x0, **options)
+    # The descent methods never evaluate fun at their final point
+    return OptimizeResult(x, fun(x), iterations, function_uses + 1, "gradient_descent", history=history)
+
+
+def _steepest_descent(fun, x0, jac, options):
+    history, x, function_uses, stats_additional, iterations = descent.steepest_descent(fun, jac, x0, **options)
+    return OptimizeResult(x, fun(x), iterations, function_uses + stats_additional["function_uses"] + 1,
+                          "steepest_descent", history=history, line_search=stats_additional)
+
+
+_SOLVERS = {
+    "nelder_mead": _nelder_mead,
+    "gradient_descent": _gradient_descent,
+    "steepest_descent": _steepest_descent,
+}
+
+
+def minimize(fun, x0, method="nelder_mead", jac=None, options=None):
+    """Minimizes fun from x0 with one of METHODS and returns an OptimizeResult.
+
+    Method names are case insensitive and may use "-" instead of "_"
+    ("Nelder-Mead"). jac is the gradient, required by the descent methods.
+    options are passed on as keyword arguments to om.nelder_mead.simplex_search,
+    om.descent.gradient_descent or om.descent.steepest_descent.
+    """
+    name = method.lower().replace("-", "_").replace(" ", "_")
+    if name not in _SOLVERS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {METHODS}")
+    if jac is None and name != "nelder_mead":
+        raise ValueError(f"Method {method!r} needs the gradient as jac")
+    return _SOLVERS[name](fun, x0, jac, dict(options or {}))